@@ -35,6 +35,7 @@ from canonizer.api import (
     canonicalize_email_from_gmail,
     canonicalize_form_response,
     execute,
+    load_inputs,
     run_batch,
     validate_payload,
 )
@@ -44,6 +45,7 @@ __all__ = [
     "canonicalize",
     "run_batch",
     "execute",
+    "load_inputs",
     "validate_payload",
     "canonicalize_email_from_gmail",
     "canonicalize_email_from_exchange",
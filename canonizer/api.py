@@ -12,20 +12,39 @@ Core principles:
 NO orchestration logic - no events, no BigQuery, no job patterns.
 """
 
+import json
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from canonizer.callable.result import CallableResult
-from canonizer.core.runtime import TransformRuntime
 from canonizer.core.validator import SchemaValidator, ValidationError, load_schema_from_iglu_uri
-from canonizer.local.config import CONFIG_FILENAME, CanonizerConfig
-from canonizer.local.resolver import (
-    CanonizerRootNotFoundError,
-    find_canonizer_root,
-    resolve_schema,
-    resolve_transform,
-)
+
+if TYPE_CHECKING:
+    from canonizer.core.runtime import TransformRuntime
+
+# canonizer.core.runtime, canonizer.local.config and canonizer.local.resolver
+# pull in pydantic and yaml, which dominate cold-start time. They are imported
+# lazily inside the functions that need them so `import canonizer` stays cheap
+# for callers that only validate or inspect.
+
+# Default transform for each source_type accepted by execute().
+# Built once at import time so dispatch is a single dict lookup.
+_SOURCE_TYPE_TRANSFORMS = {
+    "email": "email/gmail_to_jmap_lite@1.0.0",
+    "gmail": "email/gmail_to_jmap_lite@1.0.0",
+    "exchange": "email/exchange_to_jmap_lite@1.0.0",
+    "form": "forms/google_forms_to_canonical@1.0.0",
+    "google_forms": "forms/google_forms_to_canonical@1.0.0",
+}
+
+# Registry-style transform ID: "domain/name@version". Compiled once at
+# import; mirrors TRANSFORM_PATTERN in canonizer.local.resolver.
+_TRANSFORM_ID_RE = re.compile(r"^([a-zA-Z0-9_/-]+)@(\d+[.\-]\d+[.\-]\d+)$")
+
 
 # ============================================================================
 # Registry Root Resolution
@@ -34,6 +53,8 @@ from canonizer.local.resolver import (
 
 def _try_find_canonizer_root() -> Path | None:
     """Try to find .canonizer/ directory, return None if not found."""
+    from canonizer.local.resolver import CanonizerRootNotFoundError, find_canonizer_root
+
     try:
         return find_canonizer_root()
     except CanonizerRootNotFoundError:
@@ -59,6 +80,8 @@ def get_registry_root() -> Path:
         >>> print(root / "schemas")
         /workspace/canonizer/schemas
     """
+    from canonizer.local.config import CONFIG_FILENAME, CanonizerConfig
+
     # Try local .canonizer/ first
     canonizer_root = _try_find_canonizer_root()
     if canonizer_root:
@@ -79,10 +102,111 @@ def get_registry_root() -> Path:
     return Path.cwd()
 
 
+# ============================================================================
+# Bulk Input Loading
+# ============================================================================
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+def _load_inputs_io_uring(paths: list[Path]) -> dict[str, bytes]:
+    """Read all paths with one batched io_uring submission.
+
+    Every read is queued as an SQE, submitted with a single
+    io_uring_enter, and the CQEs are drained as they complete.
+    """
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(max(len(paths), 1), ring)
+    fds: list[int] = []
+    try:
+        buffers: list[bytearray] = []
+        for i, path in enumerate(paths):
+            fd = os.open(path, os.O_RDONLY)
+            fds.append(fd)
+            buffers.append(bytearray(os.fstat(fd).st_size))
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buffers[i], len(buffers[i]), 0)
+            sqe.user_data = i
+        liburing.io_uring_submit(ring)
+
+        results: dict[str, bytes] = {}
+        cqe = liburing.io_uring_cqe()
+        for _ in paths:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            index = cqe.user_data
+            nread = liburing.trap_error(cqe.res)
+            results[str(paths[index])] = bytes(buffers[index][:nread])
+            liburing.io_uring_cqe_seen(ring, cqe)
+        return results
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+
+
+def load_inputs(paths: list[str | Path]) -> dict[str, bytes]:
+    """Read many small input files in one batch.
+
+    Registry metadata and golden fixtures are lots of tiny JSON/YAML
+    files; reading them one open/read/close at a time is dominated by
+    syscall overhead. When liburing is installed (Linux only), all reads
+    are submitted as a single io_uring batch. Everywhere else this falls
+    back to plain sequential reads with identical results.
+
+    Args:
+        paths: File paths to read
+
+    Returns:
+        Dict mapping str(path) to file contents as bytes
+
+    Raises:
+        FileNotFoundError: If any path does not exist
+    """
+    resolved = [Path(p) for p in paths]
+    if liburing is not None:
+        try:
+            return _load_inputs_io_uring(resolved)
+        except OSError:
+            # Kernel without io_uring support - fall through to sync reads
+            pass
+    return {str(p): p.read_bytes() for p in resolved}
+
+
 # ============================================================================
 # Validation API
 # ============================================================================
 
+# Memoized (is_valid, errors) results keyed by serialized payload plus the
+# resolved schema path and its mtime, so editing a schema file invalidates
+# naturally. Repeated validation of the same document (retries, property
+# tests) skips the Node round-trip entirely. Bounded LRU: oldest entry
+# evicted at size.
+_VALIDATION_CACHE_SIZE = 1024
+_validation_cache: OrderedDict[tuple[str, str, int], tuple[bool, tuple[str, ...]]] = (
+    OrderedDict()
+)
+
+# SchemaValidator instances keyed by (schema path, mtime); an edited
+# schema file invalidates naturally. Reusing the instance also reuses
+# its accepted-payload digests across validate_payload calls.
+_schema_validators: dict[tuple[str, float], SchemaValidator] = {}
+
+
+def _get_schema_validator(schema_path: Path) -> SchemaValidator:
+    """Resolve a schema path to a cached SchemaValidator."""
+    try:
+        mtime = os.path.getmtime(schema_path)
+    except OSError:
+        mtime = -1.0
+    key = (str(schema_path), mtime)
+    validator = _schema_validators.get(key)
+    if validator is None:
+        validator = _schema_validators[key] = SchemaValidator(schema_path)
+    return validator
+
 
 def validate_payload(
     payload: dict[str, Any],
@@ -109,6 +233,11 @@ def validate_payload(
         - is_valid: True if payload passes validation
         - errors: List of error messages (empty if valid)
 
+    Note:
+        Results are memoized per (payload, resolved schema path, schema
+        mtime), so re-validating an identical document is free within a
+        process while schema edits still take effect.
+
     Example:
         >>> from canonizer import validate_payload
         >>> is_valid, errors = validate_payload(
@@ -118,29 +247,70 @@ def validate_payload(
         >>> if not is_valid:
         ...     print(f"Validation failed: {errors}")
     """
+    # Resolve the schema first: the cache key must carry the resolved
+    # path and its mtime so schema edits (and cwd-dependent resolution)
+    # cannot return stale verdicts. Resolution failures are not cached.
     try:
-        # Determine schema path
-        if schemas_dir is not None:
-            # Explicit schemas_dir provided - use it
-            schemas_dir = Path(schemas_dir)
-            schema_path = load_schema_from_iglu_uri(schema_iglu, schemas_dir)
-        else:
-            # Try local .canonizer/ resolution first
-            canonizer_root = _try_find_canonizer_root()
-            if canonizer_root:
-                schema_path = resolve_schema(schema_iglu, canonizer_root)
-            else:
-                # Fall back to old resolution
-                schemas_dir = get_registry_root() / "schemas"
-                schema_path = load_schema_from_iglu_uri(schema_iglu, schemas_dir)
+        schema_path = _resolve_schema_path(schema_iglu, schemas_dir)
+    except Exception as e:
+        return False, [str(e)]
 
-        if not schema_path.exists():
-            return False, [f"Schema file not found: {schema_path}"]
+    try:
+        mtime_ns = schema_path.stat().st_mtime_ns
+    except OSError:
+        return False, [f"Schema file not found: {schema_path}"]
 
-        # Validate payload against schema
-        validator = SchemaValidator(schema_path)
-        validator.validate(payload)
+    # dicts are unhashable, so key the cache on the sorted serialization.
+    # Unserializable payloads simply bypass the cache.
+    try:
+        cache_key = (
+            json.dumps(payload, sort_keys=True, separators=(",", ":")),
+            str(schema_path),
+            mtime_ns,
+        )
+    except (TypeError, ValueError):
+        cache_key = None
+
+    if cache_key is not None and cache_key in _validation_cache:
+        _validation_cache.move_to_end(cache_key)
+        is_valid, errors = _validation_cache[cache_key]
+        return is_valid, list(errors)
+
+    is_valid, errors_list = _validate_payload_uncached(payload, schema_path)
+
+    if cache_key is not None:
+        _validation_cache[cache_key] = (is_valid, tuple(errors_list))
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+
+    return is_valid, errors_list
+
+
+def _resolve_schema_path(schema_iglu: str, schemas_dir: str | Path | None) -> Path:
+    """Resolve a schema Iglu URI using validate_payload's fallback order."""
+    from canonizer.local.resolver import resolve_schema
+
+    if schemas_dir is not None:
+        # Explicit schemas_dir provided - use it
+        return load_schema_from_iglu_uri(schema_iglu, Path(schemas_dir))
+
+    # Try local .canonizer/ resolution first
+    canonizer_root = _try_find_canonizer_root()
+    if canonizer_root:
+        return resolve_schema(schema_iglu, canonizer_root)
+
+    # Fall back to old resolution
+    return load_schema_from_iglu_uri(schema_iglu, get_registry_root() / "schemas")
 
+
+def _validate_payload_uncached(
+    payload: dict[str, Any],
+    schema_path: Path,
+) -> tuple[bool, list[str]]:
+    """Run the actual schema validation (no memoization)."""
+    try:
+        validator = _get_schema_validator(schema_path)
+        validator.validate(payload)
         return True, []
 
     except ValidationError as e:
@@ -193,6 +363,38 @@ def canonicalize(
         ...     transform_id="email/gmail_to_jmap_lite@1.0.0"
         ... )
     """
+    transform_meta_path, runtime = _prepare_runtime(transform_id, schemas_dir)
+
+    # Execute transform
+    result = runtime.execute(
+        transform_meta_path=transform_meta_path,
+        input_data=raw_document,
+        validate_input=validate_input,
+        validate_output=validate_output,
+    )
+
+    return result.data
+
+
+def _prepare_runtime(
+    transform_id: str, schemas_dir: str | Path | None
+) -> tuple[Path, "TransformRuntime"]:
+    """Resolve a transform ID and build a runtime for it.
+
+    Shared setup for canonicalize() and run_batch(): resolving the
+    .meta.yaml path and schemas_dir is loop-invariant, so batch callers
+    do it once and reuse the same runtime for every document.
+
+    Args:
+        transform_id: Registry-style ID or path to .meta.yaml
+        schemas_dir: Schema directory, or None to resolve it
+
+    Returns:
+        Tuple of (transform_meta_path, TransformRuntime)
+    """
+    from canonizer.core.runtime import TransformRuntime
+    from canonizer.local.config import CONFIG_FILENAME, CanonizerConfig
+
     # Resolve transform_id to .meta.yaml path if needed
     if not transform_id.endswith(".yaml") and not transform_id.endswith(".yml"):
         # Registry-style ID - resolve to local path
@@ -210,17 +412,7 @@ def canonicalize(
         else:
             schemas_dir = get_registry_root() / "schemas"
 
-    runtime = TransformRuntime(schemas_dir=schemas_dir)
-
-    # Execute transform
-    result = runtime.execute(
-        transform_meta_path=transform_meta_path,
-        input_data=raw_document,
-        validate_input=validate_input,
-        validate_output=validate_output,
-    )
-
-    return result.data
+    return transform_meta_path, TransformRuntime(schemas_dir=schemas_dir)
 
 
 def run_batch(
@@ -234,6 +426,10 @@ def run_batch(
     """
     Transform multiple documents in batch.
 
+    Input documents are treated as read-only and never copied - aliased
+    entries (the same dict repeated) are fine. Outputs are always
+    distinct objects decoded from the transform results.
+
     Args:
         documents: List of source JSON documents
         transform_id: Transform to use (e.g., "email/gmail_to_jmap_lite@1.0.0")
@@ -251,16 +447,30 @@ def run_batch(
         ...     transform_id="email/gmail_to_jmap_lite@1.0.0"
         ... )
     """
-    return [
-        canonicalize(
-            doc,
-            transform_id=transform_id,
-            schemas_dir=schemas_dir,
+    if not documents:
+        return []
+
+    # Resolve the transform and build the runtime once for the whole batch
+    transform_meta_path, runtime = _prepare_runtime(transform_id, schemas_dir)
+
+    def _run_one(doc: dict) -> dict:
+        data: dict = runtime.execute(
+            transform_meta_path=transform_meta_path,
+            input_data=doc,
             validate_input=validate_input,
             validate_output=validate_output,
-        )
-        for doc in documents
-    ]
+        ).data
+        return data
+
+    if len(documents) == 1:
+        return [_run_one(documents[0])]
+
+    # Each execute is an independent Node subprocess, so the batch is
+    # IO-bound on process spawns; overlapping them hides the per-spawn
+    # startup latency. map preserves input order.
+    workers = min(len(documents), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_one, documents))
 
 
 # ============================================================================
@@ -268,6 +478,41 @@ def run_batch(
 # ============================================================================
 
 
+class _ExecuteRequest(NamedTuple):
+    """Validated execute() request envelope."""
+
+    source_type: str
+    items: list
+    config: dict
+
+
+def _parse_execute_params(params: dict) -> _ExecuteRequest:
+    """Validate the execute() request envelope in one place.
+
+    Args:
+        params: Raw params dict passed to execute()
+
+    Returns:
+        _ExecuteRequest with defaults applied
+
+    Raises:
+        ValueError: If required parameters are missing or invalid
+    """
+    source_type = params.get("source_type")
+    if source_type is None:
+        raise ValueError("Missing required parameter: 'source_type'")
+
+    items = params.get("items", [])
+    if not isinstance(items, list):
+        raise ValueError("Parameter 'items' must be a list")
+
+    return _ExecuteRequest(
+        source_type=source_type,
+        items=items,
+        config=params.get("config", {}),
+    )
+
+
 def execute(params: dict) -> dict:
     """Execute canonization and return CallableResult.
 
@@ -281,6 +526,8 @@ def execute(params: dict) -> dict:
             - items (list[dict]): List of raw documents to canonize
             - config (dict, optional): Configuration options:
                 - transform_id (str, optional): Explicit transform ID to use
+                - pipeline (list[str], optional): Transform IDs applied in
+                  order for multi-stage processing (overrides transform_id)
                 - validate_input (bool, default True): Validate input schema
                 - validate_output (bool, default True): Validate output schema
                 - schemas_dir (str, optional): Schema directory path
@@ -313,26 +560,31 @@ def execute(params: dict) -> dict:
         >>> print(result["items"])
         [{'id': '...', 'subject': '...'}]
     """
-    # Extract parameters
-    source_type = params.get("source_type")
-    items = params.get("items", [])
-    config = params.get("config", {})
-
-    # Validate required parameters
-    if source_type is None:
-        raise ValueError("Missing required parameter: 'source_type'")
-
-    if not isinstance(items, list):
-        raise ValueError("Parameter 'items' must be a list")
+    # Validate and unpack the request envelope
+    source_type, items, config = _parse_execute_params(params)
 
     # Extract config options
-    transform_id = config.get("transform_id")
+    transform_id: str | None = config.get("transform_id")
     validate_input = config.get("validate_input", True)
     validate_output = config.get("validate_output", True)
     schemas_dir = config.get("schemas_dir")
     transform_config = config.get("transform_config")
     max_error_samples = int(config.get("max_error_samples", 20))
 
+    # Multi-stage pipelines: config["pipeline"] lists transform IDs applied in
+    # order. Each document streams through the whole chain one at a time, so
+    # no intermediate per-stage batch is ever materialized. Only the first
+    # stage validates input and only the last stage validates output.
+    pipeline = config.get("pipeline")
+    if pipeline is not None:
+        if not isinstance(pipeline, list) or not pipeline:
+            raise ValueError("Config 'pipeline' must be a non-empty list of transform IDs")
+        if transform_id is not None:
+            raise ValueError(
+                "Config keys 'transform_id' and 'pipeline' are mutually exclusive; "
+                "list the transform as a pipeline stage instead"
+            )
+
     # For formation/projection transforms, if transform_config not explicitly provided,
     # extract transform-specific fields from config itself. This allows job
     # YAMLs to put binding_id, source_system, etc. directly in config without
@@ -352,9 +604,25 @@ def execute(params: dict) -> dict:
         transform_config = {k: v for k, v in config.items() if k in transform_fields}
 
     # Determine transform_id from source_type if not explicitly provided
-    if transform_id is None:
+    if transform_id is None and pipeline is None:
         transform_id = _get_default_transform_id(source_type)
 
+    def _run_pipeline(doc: dict, stages: list[str]) -> dict | None:
+        """Run a document through every pipeline stage, stopping on None."""
+        last = len(stages) - 1
+        for i, stage_id in enumerate(stages):
+            out = canonicalize(
+                doc,
+                transform_id=stage_id,
+                schemas_dir=schemas_dir,
+                validate_input=validate_input and i == 0,
+                validate_output=validate_output and i == last,
+            )
+            if out is None:
+                return None
+            doc = out
+        return doc
+
     # Track statistics
     input_count = len(items)
     output_items: list[dict] = []
@@ -365,15 +633,14 @@ def execute(params: dict) -> dict:
 
     # Aggregation mode for projection transforms (sqlite.sync, sheets.write_table)
     # These transforms take ALL rows as input and produce a single packaged output
-    is_aggregation = isinstance(transform_id, str) and transform_id.startswith("projection/")
-    if is_aggregation:
+    if transform_id is not None and transform_id.startswith("projection/"):
         try:
             # Build aggregation input: all rows + config
             agg_input = {
                 "rows": items,
                 "config": transform_config or {},
             }
-            canonized = canonicalize(
+            canonized: dict | None = canonicalize(
                 agg_input,
                 transform_id=transform_id,
                 schemas_dir=schemas_dir,
@@ -410,6 +677,11 @@ def execute(params: dict) -> dict:
         )
         return result.to_dict()
 
+    # Loop invariant: depends only on the transform, not on the item
+    preserve_wrapper = isinstance(transform_id, str) and (
+        transform_id.startswith("formation/") or transform_id.startswith("projection/")
+    )
+
     # Process each item (non-aggregation mode for formation and other transforms)
     for item in items:
         try:
@@ -419,19 +691,13 @@ def execute(params: dict) -> dict:
             # Detect BQ rows by the presence of idem_key — raw documents
             # never have this field. Some raw formats (e.g., Gmail API)
             # have their own "payload" key, so we can't use that alone.
-            preserve_wrapper = isinstance(transform_id, str) and (
-                transform_id.startswith("formation/") or transform_id.startswith("projection/")
-            )
-
             raw_doc = item
             passthrough = None
             is_bq_row = isinstance(item, dict) and "idem_key" in item and "payload" in item
             if is_bq_row:
                 payload_value = item["payload"]
                 if isinstance(payload_value, str):
-                    import json as _json
-
-                    payload_value = _json.loads(payload_value)
+                    payload_value = json.loads(payload_value)
 
                 if preserve_wrapper:
                     raw_doc = dict(item)
@@ -450,13 +716,19 @@ def execute(params: dict) -> dict:
                 raw_doc = dict(raw_doc)
                 raw_doc["config"] = transform_config
 
-            canonized = canonicalize(
-                raw_doc,
-                transform_id=transform_id,
-                schemas_dir=schemas_dir,
-                validate_input=validate_input,
-                validate_output=validate_output,
-            )
+            if pipeline is not None:
+                canonized = _run_pipeline(raw_doc, pipeline)
+            elif transform_id is not None:
+                canonized = canonicalize(
+                    raw_doc,
+                    transform_id=transform_id,
+                    schemas_dir=schemas_dir,
+                    validate_input=validate_input,
+                    validate_output=validate_output,
+                )
+            else:
+                # Unreachable: transform_id is defaulted whenever pipeline is absent
+                raise RuntimeError("No transform_id or pipeline configured")
 
             if canonized is None:
                 skipped_count += 1
@@ -523,23 +795,15 @@ def _get_default_transform_id(source_type: str) -> str:
     Raises:
         ValueError: If source type is unknown
     """
-    # Map source types to default transforms
-    default_transforms = {
-        "email": "email/gmail_to_jmap_lite@1.0.0",
-        "gmail": "email/gmail_to_jmap_lite@1.0.0",
-        "exchange": "email/exchange_to_jmap_lite@1.0.0",
-        "form": "forms/google_forms_to_canonical@1.0.0",
-        "google_forms": "forms/google_forms_to_canonical@1.0.0",
-    }
-
-    if source_type not in default_transforms:
+    transform_id = _SOURCE_TYPE_TRANSFORMS.get(source_type)
+    if transform_id is None:
         raise ValueError(
             f"Unknown source_type: {source_type}. "
             f"Provide explicit 'transform_id' in config or use one of: "
-            f"{', '.join(sorted(default_transforms.keys()))}"
+            f"{', '.join(sorted(_SOURCE_TYPE_TRANSFORMS.keys()))}"
         )
 
-    return default_transforms[source_type]
+    return transform_id
 
 
 # ============================================================================
@@ -656,8 +920,11 @@ def _resolve_transform_id(transform_id: str) -> Path:
         ValueError: If transform_id format is invalid
         FileNotFoundError: If transform doesn't exist locally
     """
+    from canonizer.local.resolver import resolve_transform
+
     # Parse registry-style ID: "domain/name@version"
-    if "@" not in transform_id:
+    match = _TRANSFORM_ID_RE.match(transform_id)
+    if match is None:
         raise ValueError(
             f"Invalid transform_id: {transform_id}. "
             f'Expected format: "domain/name@version" (e.g., "email/gmail_to_jmap_lite@1.0.0")'
@@ -669,7 +936,7 @@ def _resolve_transform_id(transform_id: str) -> Path:
         return resolve_transform(transform_id, canonizer_root)
 
     # Fall back to old resolution
-    path_part, version = transform_id.rsplit("@", 1)
+    path_part, version = match.groups()
     registry_root = get_registry_root()
 
     # Convert to local path
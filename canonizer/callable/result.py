@@ -6,7 +6,7 @@ Defines the response schema for the in-process execute() interface.
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CallableResult:
     """Result of callable execution.
 
@@ -22,6 +22,9 @@ class CallableResult:
         Exactly one of `items` or `items_ref` must be provided.
         v0 implementation only supports `items`; `items_ref` is reserved for
         future artifact store integration.
+
+        Slotted because one instance is built per execute() call; slots
+        drop the per-instance __dict__ and speed up field access.
     """
 
     schema_version: str = "1.0"
@@ -1,6 +1,7 @@
 """CLI command for importing schemas and transforms from a registry repo."""
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 import typer
@@ -91,11 +92,12 @@ def import_schema(
     # Create parent directories
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Copy file
-    shutil.copy2(source_path, dest_path)
+    # Read once, write once, and hash the bytes already in hand rather
+    # than copying and then re-reading the destination for the lock entry
+    content = source_path.read_bytes()
+    dest_path.write_bytes(content)
 
     # Update lock file
-    content = dest_path.read_bytes()
     lock.add_schema(ref, rel_path, content)
 
     return dest_path
@@ -270,17 +272,27 @@ def import_run(
         raise typer.Exit(code=1)
 
 
-def collect_schema_refs(source_registry: Path) -> list[str]:
-    """Collect all schema references from a registry directory.
+@lru_cache(maxsize=8)
+def _scan_registry(
+    source_registry: str, _mtime_ns: int
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Walk a source registry once, collecting schema and transform refs.
+
+    Memoized on (path, registry mtime) so commands that need both ref
+    lists in one invocation (e.g. 'import all') walk the tree once.
 
     Args:
-        source_registry: Path to source registry repo
+        source_registry: Path to source registry repo (as a string)
+        _mtime_ns: st_mtime_ns of the registry root, part of the cache key
 
     Returns:
-        List of schema references (iglu:vendor/name/jsonschema/version)
+        Tuple of (schema refs, transform refs), both sorted
     """
-    refs = []
-    schemas_dir = source_registry / "schemas"
+    schema_refs: list[str] = []
+    transform_refs: list[str] = []
+    root = Path(source_registry)
+
+    schemas_dir = root / "schemas"
     if schemas_dir.exists():
         for vendor_dir in sorted(schemas_dir.iterdir()):
             if vendor_dir.is_dir():
@@ -291,8 +303,43 @@ def collect_schema_refs(source_registry: Path) -> list[str]:
                             for version_file in sorted(jsonschema_dir.glob("*.json")):
                                 version = version_file.stem
                                 ref = f"iglu:{vendor_dir.name}/{schema_dir.name}/jsonschema/{version}"
-                                refs.append(ref)
-    return refs
+                                schema_refs.append(ref)
+
+    transforms_dir = root / "transforms"
+    if transforms_dir.exists():
+        for cat_dir in sorted(transforms_dir.iterdir()):
+            if cat_dir.is_dir():
+                for transform_dir in sorted(cat_dir.iterdir()):
+                    if transform_dir.is_dir():
+                        for version_dir in sorted(transform_dir.iterdir()):
+                            if version_dir.is_dir() and (version_dir / "spec.meta.yaml").exists():
+                                ref = f"{cat_dir.name}/{transform_dir.name}@{version_dir.name}"
+                                transform_refs.append(ref)
+
+    return tuple(schema_refs), tuple(transform_refs)
+
+
+def _registry_mtime_ns(source_registry: Path) -> int:
+    """Cache-key component for _scan_registry; -1 if the root is unreadable."""
+    try:
+        return source_registry.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def collect_schema_refs(source_registry: Path) -> list[str]:
+    """Collect all schema references from a registry directory.
+
+    Args:
+        source_registry: Path to source registry repo
+
+    Returns:
+        List of schema references (iglu:vendor/name/jsonschema/version)
+    """
+    schema_refs, _ = _scan_registry(
+        str(source_registry), _registry_mtime_ns(source_registry)
+    )
+    return list(schema_refs)
 
 
 def collect_transform_refs(
@@ -307,20 +354,12 @@ def collect_transform_refs(
     Returns:
         List of transform references (category/name@version)
     """
-    refs = []
-    transforms_dir = source_registry / "transforms"
-    if transforms_dir.exists():
-        for cat_dir in sorted(transforms_dir.iterdir()):
-            if cat_dir.is_dir():
-                if category and cat_dir.name != category:
-                    continue
-                for transform_dir in sorted(cat_dir.iterdir()):
-                    if transform_dir.is_dir():
-                        for version_dir in sorted(transform_dir.iterdir()):
-                            if version_dir.is_dir() and (version_dir / "spec.meta.yaml").exists():
-                                ref = f"{cat_dir.name}/{transform_dir.name}@{version_dir.name}"
-                                refs.append(ref)
-    return refs
+    _, transform_refs = _scan_registry(
+        str(source_registry), _registry_mtime_ns(source_registry)
+    )
+    if category:
+        return [ref for ref in transform_refs if ref.split("/", 1)[0] == category]
+    return list(transform_refs)
 
 
 @app.command("all")
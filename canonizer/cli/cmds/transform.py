@@ -153,8 +153,7 @@ def list(
         table.add_column("Status", style="green")
         table.add_column("From → To", style="white")
 
-        for meta_file in meta_files:
-            transform = TransformLoader.load(meta_file)
+        for transform in TransformLoader.load_many(meta_files):
             table.add_row(
                 transform.meta.id,
                 transform.meta.version,
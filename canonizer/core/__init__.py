@@ -1,5 +1,15 @@
 """Core runtime engine for Canonizer."""
 
-from canonizer.core.runtime import TransformRuntime
+from typing import Any
 
 __all__ = ["TransformRuntime"]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy re-export (PEP 562): importing the runtime pulls in pydantic and
+    # yaml, which would otherwise be paid by every `import canonizer`.
+    if name == "TransformRuntime":
+        from canonizer.core.runtime import TransformRuntime
+
+        return TransformRuntime
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,22 @@
 """Schema differ: classify schema changes (add/rename/remove/type-change)."""
 
 import json
+from collections.abc import Callable
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+# Optional C fast path for rename detection (bit-parallel Levenshtein);
+# the pure-Python DP below is the fallback.
+_levenshtein_fn: Callable[..., int] | None
+try:
+    from rapidfuzz.distance.Levenshtein import distance as _levenshtein_fn
+except ImportError:  # pragma: no cover
+    _levenshtein_fn = None
+
 
 class ChangeType(str, Enum):
     """Types of schema changes."""
@@ -93,9 +103,9 @@ class SchemaDiffer:
         from_props = from_schema_dict.get("properties", {})
         to_props = to_schema_dict.get("properties", {})
 
-        # Get required fields
-        from_required = set(from_schema_dict.get("required", []))
-        to_required = set(to_schema_dict.get("required", []))
+        # Get required fields (built once; every membership check below is O(1))
+        from_required = frozenset(from_schema_dict.get("required") or ())
+        to_required = frozenset(to_schema_dict.get("required") or ())
 
         changes: list[SchemaChange] = []
 
@@ -165,14 +175,21 @@ class SchemaDiffer:
                 changes.append(change)
 
         # Detect renames (heuristic: similar names, same type)
-        # This is a simple heuristic - more sophisticated matching could be added
+        # This is a simple heuristic - more sophisticated matching could be added.
+        # Lowercased names are computed once up front instead of per pair, and
+        # the superseded ADD/REMOVE changes are filtered in a single pass below.
+        removed_lower = {field: field.lower() for field in removed_fields}
+        added_lower = {field: field.lower() for field in added_fields}
+        renames: list[SchemaChange] = []
+        renamed_added: set[str] = set()
+        renamed_removed: set[str] = set()
         for removed in removed_fields:
             for added in added_fields:
                 # Check if names are similar (simple substring match)
                 if (
-                    removed.lower() in added.lower()
-                    or added.lower() in removed.lower()
-                    or _levenshtein_distance(removed, added) <= 3
+                    removed_lower[removed] in added_lower[added]
+                    or added_lower[added] in removed_lower[removed]
+                    or _levenshtein_distance(removed, added, max_distance=3) <= 3
                 ):
                     # Check if types match
                     from_type = from_props[removed].get("type")
@@ -180,27 +197,32 @@ class SchemaDiffer:
 
                     if from_type == to_type:
                         # Likely a rename - mark both changes as rename
-                        # Remove the original ADD and REMOVE changes
-                        changes = [
-                            c
-                            for c in changes
-                            if not (
-                                (c.change_type == ChangeType.ADD and c.path == added)
-                                or (c.change_type == ChangeType.REMOVE and c.path == removed)
+                        renamed_added.add(added)
+                        renamed_removed.add(removed)
+                        renames.append(
+                            SchemaChange(
+                                change_type=ChangeType.RENAME,
+                                path=f"{removed}→{added}",
+                                old_value=from_props[removed],
+                                new_value=to_props[added],
+                                description=f"Field renamed: '{removed}' → '{added}'",
+                                auto_patchable=True,
                             )
-                        ]
-
-                        change = SchemaChange(
-                            change_type=ChangeType.RENAME,
-                            path=f"{removed}→{added}",
-                            old_value=from_props[removed],
-                            new_value=to_props[added],
-                            description=f"Field renamed: '{removed}' → '{added}'",
-                            auto_patchable=True,
                         )
-                        changes.append(change)
                         break
 
+        if renames:
+            # Drop the ADD/REMOVE changes subsumed by the detected renames
+            changes = [
+                c
+                for c in changes
+                if not (
+                    (c.change_type == ChangeType.ADD and c.path in renamed_added)
+                    or (c.change_type == ChangeType.REMOVE and c.path in renamed_removed)
+                )
+            ]
+            changes.extend(renames)
+
         # Calculate counts
         auto_patchable_count = sum(1 for c in changes if c.auto_patchable)
         manual_review_count = len(changes) - auto_patchable_count
@@ -214,27 +236,57 @@ class SchemaDiffer:
         )
 
 
-def _levenshtein_distance(s1: str, s2: str) -> int:
+def _levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
     """
     Calculate Levenshtein distance between two strings.
 
-    Used for rename detection heuristics.
+    Used for rename detection heuristics. Delegates to rapidfuzz's
+    C implementation when available; values are identical either way.
+
+    When max_distance is given, the exact distance is only needed up to
+    that bound: any result greater than max_distance is reported as
+    max_distance + 1, allowing the computation to bail out early.
+
+    Results are memoized; the distance is symmetric, so the pair is
+    ordered before lookup to share cache entries across (a, b) and (b, a).
     """
+    if s2 < s1:
+        s1, s2 = s2, s1
+    return _levenshtein_cached(s1, s2, max_distance)
+
+
+@lru_cache(maxsize=4096)
+def _levenshtein_cached(s1: str, s2: str, max_distance: int | None) -> int:
+    if max_distance is not None and abs(len(s1) - len(s2)) > max_distance:
+        # The distance is at least the length difference.
+        return max_distance + 1
+
+    if _levenshtein_fn is not None:
+        if max_distance is not None:
+            return _levenshtein_fn(s1, s2, score_cutoff=max_distance)
+        return _levenshtein_fn(s1, s2)
+
     if len(s1) < len(s2):
-        return _levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
 
     if len(s2) == 0:
         return len(s1)
 
-    previous_row = range(len(s2) + 1)
+    previous_row = list(range(len(s2) + 1))
     for i, c1 in enumerate(s1):
         current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Cost of insertions, deletions, or substitutions
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
+        append = current_row.append
+        left = i + 1
+        diagonal = previous_row[0]
+        # Carry the left/diagonal cells in locals instead of re-indexing
+        # the rows on every iteration of the inner loop.
+        for above, c2 in zip(previous_row[1:], s2):
+            left = min(above + 1, left + 1, diagonal + (c1 != c2))
+            append(left)
+            diagonal = above
+        if max_distance is not None and min(current_row) > max_distance:
+            # Every cell already exceeds the bound; it can only grow.
+            return max_distance + 1
         previous_row = current_row
 
     return previous_row[-1]
@@ -10,7 +10,7 @@ from typing import Any, Literal
 
 from pydantic import BaseModel
 
-from canonizer.core.node_bridge import get_canonizer_core_bin
+from canonizer.core.node_bridge import get_bridge_tmpdir, get_canonizer_core_bin
 
 
 class JSONataExecutionError(Exception):
@@ -70,13 +70,15 @@ class JSONataExecutor:
         try:
             # Write input to temp file
             with tempfile.NamedTemporaryFile(
-                mode="wb", suffix=".json", delete=False
+                mode="wb", suffix=".json", delete=False, dir=get_bridge_tmpdir()
             ) as f:
-                f.write(json.dumps(input_data).encode("utf-8"))
+                # Compact separators: no wasted whitespace in the payload
+                # handed to the Node process.
+                f.write(json.dumps(input_data, separators=(",", ":")).encode("utf-8"))
                 input_file = f.name
 
             # Create output temp file
-            output_fd, output_file = tempfile.mkstemp(suffix=".json")
+            output_fd, output_file = tempfile.mkstemp(suffix=".json", dir=get_bridge_tmpdir())
             os.close(output_fd)
 
             with open(input_file, "rb") as stdin_fh, open(output_file, "wb") as stdout_fh:
@@ -85,6 +87,7 @@ class JSONataExecutor:
                     stdin=stdin_fh,
                     stdout=stdout_fh,
                     stderr=subprocess.PIPE,
+                    close_fds=False,  # posix_spawn fast path; CLI ignores extra fds
                 )
                 _, stderr_bytes = proc.communicate(timeout=30)
 
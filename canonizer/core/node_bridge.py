@@ -2,6 +2,7 @@
 
 import os
 import shutil
+from functools import cache
 from pathlib import Path
 
 
@@ -13,6 +14,10 @@ def get_canonizer_core_bin() -> str:
     2. Repo-local dev path: packages/canonizer-core/bin/canonizer-core
     3. System PATH
 
+    The env check stays live so overrides keep working, but the
+    filesystem probing (repo walk + PATH lookup) is cached for the
+    process lifetime - every execute() after the first skips it.
+
     Returns:
         Path to canonizer-core binary
 
@@ -26,6 +31,12 @@ def get_canonizer_core_bin() -> str:
             return env_bin
         raise RuntimeError(f"CANONIZER_CORE_BIN path does not exist: {env_bin}")
 
+    return _probe_canonizer_core_bin()
+
+
+@cache
+def _probe_canonizer_core_bin() -> str:
+    """Locate the binary on disk or PATH, once per process."""
     # 2. Check for repo-local dev path
     # Walk up from this file to find repo root
     current = Path(__file__).resolve()
@@ -46,6 +57,23 @@ def get_canonizer_core_bin() -> str:
     )
 
 
+def get_bridge_tmpdir() -> str | None:
+    """Get the directory for bridge scratch files.
+
+    The bridge hands payloads to the Node process through temp files.
+    On Linux, /dev/shm keeps those files in memory so the handoff never
+    touches disk; elsewhere this returns None and tempfile falls back
+    to its default directory.
+
+    Returns:
+        Directory path for temp files, or None for the tempfile default
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return None
+
+
 def get_registry_root() -> str:
     """Get the registry root directory.
 
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any, NamedTuple
 
 from canonizer.core.jsonata_exec import JSONataExecutor
-from canonizer.core.node_bridge import get_canonizer_core_bin
+from canonizer.core.node_bridge import get_bridge_tmpdir, get_canonizer_core_bin
 from canonizer.core.validator import SchemaValidator, load_schema_from_iglu_uri
 from canonizer.registry.loader import TransformLoader
 
@@ -42,6 +42,10 @@ class TransformRuntime:
             schemas_dir: Base directory for schema files (default: "schemas")
         """
         self.schemas_dir = Path(schemas_dir)
+        # SchemaValidator cache keyed by (schema_path, mtime); repeated
+        # validated executes reuse the resolved validator instead of
+        # re-resolving and re-checking the schema file per call.
+        self._validators: dict[tuple[str, float], SchemaValidator] = {}
 
     def execute(
         self,
@@ -80,11 +84,7 @@ class TransformRuntime:
 
         # 3. Validate input (optional but recommended)
         if validate_input:
-            input_schema_path = load_schema_from_iglu_uri(
-                transform.meta.from_schema, self.schemas_dir
-            )
-            input_validator = SchemaValidator(input_schema_path)
-            input_validator.validate(input_data)
+            self._get_validator(transform.meta.from_schema).validate(input_data)
 
         # 4. Execute JSONata transform
         # If transform has extensions, use CLI run command which registers extensions
@@ -103,11 +103,7 @@ class TransformRuntime:
 
         # 5. Validate output (optional but recommended)
         if validate_output:
-            output_schema_path = load_schema_from_iglu_uri(
-                transform.meta.to_schema, self.schemas_dir
-            )
-            output_validator = SchemaValidator(output_schema_path)
-            output_validator.validate(output)
+            self._get_validator(transform.meta.to_schema).validate(output)
 
         return TransformResult(
             data=output,
@@ -115,6 +111,50 @@ class TransformRuntime:
             runtime=runtime,
         )
 
+    def run(self, transform_meta_path: Path | str, input_data: Any) -> TransformResult:
+        """
+        Execute a transform with input and output validation on.
+
+        Positional shorthand for the common fully-validated execute call.
+
+        Args:
+            transform_meta_path: Path to .meta.yaml file
+            input_data: Input data (JSON-serializable)
+
+        Returns:
+            TransformResult with output data
+        """
+        return self.execute(
+            transform_meta_path=transform_meta_path, input_data=input_data
+        )
+
+    def _get_validator(self, iglu_uri: str) -> SchemaValidator:
+        """Resolve an Iglu URI to a cached SchemaValidator.
+
+        Cache entries are keyed by (path, mtime) so an edited schema
+        file invalidates naturally.
+
+        Args:
+            iglu_uri: Iglu schema URI to resolve against schemas_dir
+
+        Returns:
+            SchemaValidator for the resolved schema file
+
+        Raises:
+            FileNotFoundError: If the schema file doesn't exist
+        """
+        schema_path = load_schema_from_iglu_uri(iglu_uri, self.schemas_dir)
+        try:
+            mtime = os.path.getmtime(schema_path)
+        except OSError:
+            mtime = -1.0  # missing file; SchemaValidator raises below
+
+        key = (str(schema_path), mtime)
+        validator = self._validators.get(key)
+        if validator is None:
+            validator = self._validators[key] = SchemaValidator(schema_path)
+        return validator
+
     def _execute_with_cli(
         self, transform, input_data: Any
     ) -> tuple[Any, float, str]:
@@ -152,13 +192,13 @@ class TransformRuntime:
         try:
             # Write input to temp file (avoids stdin pipe limits)
             with tempfile.NamedTemporaryFile(
-                mode="wb", suffix=".json", delete=False
+                mode="wb", suffix=".json", delete=False, dir=get_bridge_tmpdir()
             ) as f:
-                f.write(json.dumps(input_data).encode("utf-8"))
+                f.write(json.dumps(input_data, separators=(",", ":")).encode("utf-8"))
                 input_file = f.name
 
             # Create temp file for output (avoids stdout pipe limits)
-            output_fd, output_file = tempfile.mkstemp(suffix=".json")
+            output_fd, output_file = tempfile.mkstemp(suffix=".json", dir=get_bridge_tmpdir())
             os.close(output_fd)
 
             # Run CLI with file redirection to avoid 65KB pipe buffer truncation
@@ -175,6 +215,10 @@ class TransformRuntime:
                     stdin=stdin_fh,
                     stdout=stdout_fh,
                     stderr=subprocess.PIPE,
+                    # Inherit fds: skips the O(RLIMIT_NOFILE) close sweep and
+                    # lets CPython spawn via posix_spawn. Safe here - the CLI
+                    # only touches the fds we hand it.
+                    close_fds=False,
                 )
                 _, stderr_bytes = proc.communicate(timeout=30)
 
@@ -1,13 +1,50 @@
 """JSON Schema validation via Node.js canonizer-core."""
 
+import hashlib
 import json
 import os
 import subprocess
 import tempfile
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from canonizer.core.node_bridge import get_canonizer_core_bin
+from canonizer.core.node_bridge import get_bridge_tmpdir, get_canonizer_core_bin
+
+
+class ErrorCode(Enum):
+    """Coarse classification of ajv validation error lines."""
+
+    REQUIRED = "required"
+    TYPE = "type"
+    FORMAT = "format"
+    OTHER = "other"
+
+
+class ValidationIssue(str):
+    """A single validation error line with a typed code.
+
+    Subclasses str so callers that treat errors as plain strings keep
+    working; callers that need to match a class of error can check
+    ``issue.code`` instead of scanning the message text.
+    """
+
+    __slots__ = ("code",)
+
+    code: ErrorCode
+
+    def __new__(cls, line: str) -> "ValidationIssue":
+        issue = super().__new__(cls, line)
+        lowered = line.lower()
+        if "required" in lowered:
+            issue.code = ErrorCode.REQUIRED
+        elif "type" in lowered:
+            issue.code = ErrorCode.TYPE
+        elif "format" in lowered:
+            issue.code = ErrorCode.FORMAT
+        else:
+            issue.code = ErrorCode.OTHER
+        return issue
 
 
 class ValidationError(Exception):
@@ -39,16 +76,30 @@ class SchemaValidator:
         parts = self.schema_path.parts
         self._registry_style = "schemas" in parts
 
+        # Digests of payloads this validator has already accepted. Each
+        # validate() spawns a Node process, so re-validating an identical
+        # payload is pure overhead; the payload is serialized for the
+        # bridge anyway, making the hash nearly free.
+        self._valid_digests: set[str] = set()
+
     def validate(self, data: Any) -> None:
         """
         Validate data against schema using Node.js.
 
+        Payloads this validator has already accepted are remembered by
+        content digest, so re-validating identical data is a no-op.
+
         Args:
             data: JSON data to validate
 
         Raises:
             ValidationError: If validation fails with detailed error messages
         """
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha1(payload).hexdigest()
+        if digest in self._valid_digests:
+            return
+
         bin_path = get_canonizer_core_bin()
 
         if self._registry_style:
@@ -76,9 +127,9 @@ class SchemaValidator:
         input_file = None
         try:
             with tempfile.NamedTemporaryFile(
-                mode="wb", suffix=".json", delete=False
+                mode="wb", suffix=".json", delete=False, dir=get_bridge_tmpdir()
             ) as f:
-                f.write(json.dumps(data).encode("utf-8"))
+                f.write(payload)
                 input_file = f.name
 
             with open(input_file, "rb") as stdin_fh:
@@ -87,17 +138,22 @@ class SchemaValidator:
                     stdin=stdin_fh,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
+                    close_fds=False,  # posix_spawn fast path; CLI ignores extra fds
                 )
                 _, stderr_bytes = proc.communicate()
 
             if proc.returncode != 0:
                 # Parse error messages from stderr
                 stderr = stderr_bytes.decode("utf-8") if stderr_bytes else ""
-                errors = [line for line in stderr.strip().split("\n") if line]
+                errors: list[str] = [
+                    ValidationIssue(line) for line in stderr.strip().split("\n") if line
+                ]
                 raise ValidationError(
                     f"Validation failed with {len(errors)} error(s)",
                     errors
                 )
+
+            self._valid_digests.add(digest)
         finally:
             if input_file and os.path.exists(input_file):
                 os.unlink(input_file)
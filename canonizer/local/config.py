@@ -19,6 +19,11 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+# PyYAML's C loader/dumper when libyaml is present (~10x faster than the
+# pure-Python classes); same safe-subset semantics either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class RegistryMode(str, Enum):
     """Registry resolution mode."""
@@ -51,6 +56,11 @@ class RegistryConfig(BaseModel):
         return v
 
 
+# Parsed configs keyed by (resolved path, mtime_ns); an edited or
+# re-saved file gets a new key, so entries invalidate naturally.
+_CONFIG_CACHE: dict[tuple[str, int], CanonizerConfig] = {}
+
+
 class CanonizerConfig(BaseModel):
     """Root configuration model for .canonizer/config.yaml."""
 
@@ -63,6 +73,10 @@ class CanonizerConfig(BaseModel):
     def load(cls, config_path: Path) -> CanonizerConfig:
         """Load configuration from a YAML file.
 
+        Parsed configs are cached by path and mtime, so repeated API
+        calls against the same .canonizer/ skip the YAML parse. Callers
+        get an independent copy each time.
+
         Args:
             config_path: Path to config.yaml file
 
@@ -76,10 +90,13 @@ class CanonizerConfig(BaseModel):
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+        key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        if key not in _CONFIG_CACHE:
+            with open(config_path) as f:
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
+            _CONFIG_CACHE[key] = cls.model_validate(data)
 
-        return cls.model_validate(data)
+        return _CONFIG_CACHE[key].model_copy(deep=True)
 
     @classmethod
     def default(cls) -> CanonizerConfig:
@@ -97,7 +114,9 @@ class CanonizerConfig(BaseModel):
         data = self.model_dump(mode="json")
 
         with open(config_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+            )
 
     def get_registry_path(self, canonizer_root: Path) -> Path:
         """Get the absolute path to the registry directory.
@@ -77,6 +77,11 @@ class TransformLock(BaseModel):
         return v
 
 
+# Parsed lock files keyed by (resolved path, mtime_ns); save() rewrites
+# the file and bumps the mtime, so entries invalidate naturally.
+_LOCK_CACHE: dict[tuple[str, int], LockFile] = {}
+
+
 class LockFile(BaseModel):
     """Root model for .canonizer/lock.json."""
 
@@ -101,6 +106,10 @@ class LockFile(BaseModel):
     def load(cls, lock_path: Path) -> LockFile:
         """Load lock file from JSON.
 
+        Parsed lock files are cached by path and mtime, so repeated API
+        calls against the same .canonizer/ skip the JSON parse and model
+        validation. Callers get an independent copy each time.
+
         Args:
             lock_path: Path to lock.json file
 
@@ -114,10 +123,13 @@ class LockFile(BaseModel):
         if not lock_path.exists():
             raise FileNotFoundError(f"Lock file not found: {lock_path}")
 
-        with open(lock_path) as f:
-            data = json.load(f)
+        key = (str(lock_path.resolve()), lock_path.stat().st_mtime_ns)
+        if key not in _LOCK_CACHE:
+            # loads on raw bytes skips the text-mode decode pass
+            data = json.loads(lock_path.read_bytes())
+            _LOCK_CACHE[key] = cls.model_validate(data)
 
-        return cls.model_validate(data)
+        return _LOCK_CACHE[key].model_copy(deep=True)
 
     @classmethod
     def empty(cls) -> LockFile:
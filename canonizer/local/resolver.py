@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from canonizer.local.config import (
@@ -63,6 +64,12 @@ TRANSFORM_PATTERN = re.compile(
 )
 
 
+# Successful find_canonizer_root results keyed by resolved start path.
+# Hits are revalidated with a single config exists() check, so repeated
+# resolutions from the same directory cost one stat instead of a walk.
+_root_cache: dict[str, Path] = {}
+
+
 def find_canonizer_root(start_path: Path | None = None) -> Path:
     """Find the .canonizer/ directory by walking up the directory tree.
 
@@ -80,6 +87,10 @@ def find_canonizer_root(start_path: Path | None = None) -> Path:
 
     start_path = start_path.resolve()
 
+    cached = _root_cache.get(str(start_path))
+    if cached is not None and (cached / CONFIG_FILENAME).exists():
+        return cached
+
     # Walk up the directory tree
     current = start_path
     while current != current.parent:
@@ -88,12 +99,14 @@ def find_canonizer_root(start_path: Path | None = None) -> Path:
             # Verify it has a config.yaml
             config_path = canonizer_dir / CONFIG_FILENAME
             if config_path.exists():
+                _root_cache[str(start_path)] = canonizer_dir
                 return canonizer_dir
         current = current.parent
 
     # Check root directory too
     canonizer_dir = current / CANONIZER_DIR
     if canonizer_dir.is_dir() and (canonizer_dir / CONFIG_FILENAME).exists():
+        _root_cache[str(start_path)] = canonizer_dir
         return canonizer_dir
 
     # Only fall back to global config when start_path was not explicitly provided.
@@ -111,9 +124,13 @@ def find_canonizer_root(start_path: Path | None = None) -> Path:
     )
 
 
+@lru_cache(maxsize=1024)
 def parse_iglu_ref(schema_ref: str) -> tuple[str, str, str]:
     """Parse an Iglu schema reference into components.
 
+    Results are memoized - hot paths re-resolve the same handful of
+    references, so repeats skip the regex entirely.
+
     Args:
         schema_ref: Schema reference in format "iglu:vendor/name/jsonschema/version"
 
@@ -132,9 +149,12 @@ def parse_iglu_ref(schema_ref: str) -> tuple[str, str, str]:
     return match.group(1), match.group(2), match.group(3)
 
 
+@lru_cache(maxsize=1024)
 def parse_transform_ref(transform_ref: str) -> tuple[str, str]:
     """Parse a transform reference into components.
 
+    Memoized like parse_iglu_ref; returns are immutable tuples.
+
     Args:
         transform_ref: Transform reference in format "category/name@version"
 
@@ -1,5 +1,8 @@
 """Transform registry loader: loads .meta.yaml + corresponding .jsonata file."""
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 
@@ -7,6 +10,9 @@ import yaml
 
 from canonizer.registry.transform_meta import TransformMeta
 
+# Prefer the libyaml C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Transform(NamedTuple):
     """Complete transform: metadata + JSONata source."""
@@ -20,11 +26,19 @@ class Transform(NamedTuple):
 class TransformLoader:
     """Loads transforms from .meta.yaml + .jsonata file pairs."""
 
+    # Parsed transforms keyed by (meta path, meta mtime); each entry also
+    # records the .jsonata mtime so edits to either file miss naturally.
+    _cache: dict[tuple[str, float], tuple[Transform, float]] = {}
+
     @staticmethod
     def load(meta_yaml_path: Path | str) -> Transform:
         """
         Load a transform from its .meta.yaml file.
 
+        Parsed transforms are cached by path and file mtimes, so repeated
+        executes of the same transform skip the YAML parse, file reads,
+        and checksum hash.
+
         Args:
             meta_yaml_path: Path to .meta.yaml file
 
@@ -40,9 +54,19 @@ class TransformLoader:
         if not meta_path.exists():
             raise FileNotFoundError(f"Transform metadata not found: {meta_path}")
 
+        key = (str(meta_path), meta_path.stat().st_mtime)
+        entry = TransformLoader._cache.get(key)
+        if entry is not None:
+            transform, jsonata_mtime = entry
+            try:
+                if transform.jsonata_path.stat().st_mtime == jsonata_mtime:
+                    return transform
+            except OSError:
+                pass  # .jsonata removed since caching; reload and re-raise below
+
         # Load and parse metadata
         with open(meta_path) as f:
-            meta_dict = yaml.safe_load(f)
+            meta_dict = yaml.load(f, Loader=_YAML_LOADER)
 
         meta = TransformMeta(**meta_dict)
 
@@ -51,10 +75,11 @@ class TransformLoader:
         if not jsonata_path.exists():
             raise FileNotFoundError(f"Transform file not found: {jsonata_path}")
 
-        jsonata_source = jsonata_path.read_text()
+        jsonata_bytes = jsonata_path.read_bytes()
+        jsonata_source = jsonata_bytes.decode()
 
-        # Verify checksum
-        if not meta.verify_checksum(meta_path):
+        # Verify checksum against the bytes just read (no second file read)
+        if not meta.verify_checksum_bytes(jsonata_bytes):
             computed = meta.compute_checksum(meta_path)
             raise ValueError(
                 f"Checksum verification failed for {jsonata_path}\n"
@@ -63,18 +88,47 @@ class TransformLoader:
                 f"The .jsonata file may have been modified without updating .meta.yaml"
             )
 
-        return Transform(
+        transform = Transform(
             meta=meta,
             jsonata=jsonata_source,
             meta_path=meta_path,
             jsonata_path=jsonata_path,
         )
+        TransformLoader._cache[key] = (transform, jsonata_path.stat().st_mtime)
+        return transform
+
+    @staticmethod
+    def load_many(meta_yaml_paths: list[Path] | list[str]) -> list[Transform]:
+        """
+        Load several transforms, overlapping the per-file I/O in threads.
+
+        Each load is reads plus a hash, so a thread pool keeps the disk
+        busy instead of paying each file's latency serially. Results come
+        back in input order; the first failing load raises as usual.
+
+        Args:
+            meta_yaml_paths: Paths to .meta.yaml files
+
+        Returns:
+            List of Transform objects, one per input path
+        """
+        paths = [Path(p) for p in meta_yaml_paths]
+        if len(paths) <= 1:
+            return [TransformLoader.load(p) for p in paths]
+
+        workers = min(len(paths), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return [t for t in pool.map(TransformLoader.load, paths)]
 
     @staticmethod
     def discover(base_dir: Path | str, pattern: str = "**/*.meta.yaml") -> list[Path]:
         """
         Discover all .meta.yaml files in a directory tree.
 
+        The default pattern walks via os.scandir, which reuses the dirent
+        type information instead of stat-ing and allocating a Path per
+        entry the way glob does; other patterns fall back to glob.
+
         Args:
             base_dir: Root directory to search
             pattern: Glob pattern for finding metadata files
@@ -86,4 +140,15 @@ class TransformLoader:
         if not base.exists():
             raise FileNotFoundError(f"Directory not found: {base}")
 
-        return sorted(base.glob(pattern))
+        if pattern != "**/*.meta.yaml":
+            return sorted(base.glob(pattern))
+
+        def _walk(directory: str) -> Iterator[Path]:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _walk(entry.path)
+                    elif entry.name.endswith(".meta.yaml"):
+                        yield Path(entry.path)
+
+        return sorted(_walk(str(base)))
@@ -134,9 +134,9 @@ class TransformMeta(BaseModel):
         if not jsonata_path.exists():
             raise FileNotFoundError(f"Transform file not found: {jsonata_path}")
 
-        sha256 = hashlib.sha256()
-        sha256.update(jsonata_path.read_bytes())
-        return sha256.hexdigest()
+        # Streams through OpenSSL without materializing the whole file
+        with open(jsonata_path, "rb") as fh:
+            return hashlib.file_digest(fh, "sha256").hexdigest()
 
     def verify_checksum(self, meta_yaml_path: Path) -> bool:
         """
@@ -150,3 +150,18 @@ class TransformMeta(BaseModel):
         """
         computed = self.compute_checksum(meta_yaml_path)
         return computed == self.checksum.jsonata_sha256
+
+    def verify_checksum_bytes(self, actual_bytes: bytes) -> bool:
+        """
+        Verify that already-read .jsonata source bytes match the stored checksum.
+
+        Lets callers that hold the source in memory verify without a
+        second file read.
+
+        Args:
+            actual_bytes: Raw bytes of the .jsonata file
+
+        Returns:
+            True if checksum matches, False otherwise
+        """
+        return hashlib.sha256(actual_bytes).hexdigest() == self.checksum.jsonata_sha256
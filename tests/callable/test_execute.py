@@ -8,13 +8,17 @@ import pytest
 from canonizer import CallableResult, execute
 from canonizer.local.resolver import TransformNotFoundError
 
+# Golden fixture paths, built once at import instead of per test
+GMAIL_INPUT = Path("tests/golden/email/gmail_v1/input.json")
+EXCHANGE_INPUT = Path("tests/golden/email/exchange_v1/input.json")
+
 
 class TestExecuteBasic:
     """Basic tests for execute() function."""
 
     def test_execute_returns_dict(self):
         """execute() returns a dictionary."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -30,7 +34,7 @@ class TestExecuteBasic:
 
     def test_execute_has_schema_version(self):
         """execute() result includes schema_version."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -47,7 +51,7 @@ class TestExecuteBasic:
 
     def test_execute_returns_items_not_items_ref(self):
         """v0: execute() returns items, not items_ref."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -64,7 +68,7 @@ class TestExecuteBasic:
 
     def test_execute_includes_stats(self):
         """execute() result includes stats dict."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -86,7 +90,7 @@ class TestExecuteWithMultipleItems:
 
     def test_execute_multiple_items(self):
         """execute() processes multiple items."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -120,7 +124,7 @@ class TestExecuteDefaultTransforms:
 
     def test_execute_email_source_type(self):
         """execute() resolves 'email' source type to gmail transform."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -138,7 +142,7 @@ class TestExecuteDefaultTransforms:
 
     def test_execute_gmail_source_type(self):
         """execute() resolves 'gmail' source type to gmail transform."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -154,7 +158,7 @@ class TestExecuteDefaultTransforms:
 
     def test_execute_exchange_source_type(self):
         """execute() resolves 'exchange' source type to exchange transform."""
-        input_file = Path("tests/golden/email/exchange_v1/input.json")
+        input_file = EXCHANGE_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -213,7 +217,7 @@ class TestExecuteConfig:
 
     def test_execute_with_explicit_transform_id(self):
         """execute() uses explicit transform_id from config."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -229,7 +233,7 @@ class TestExecuteConfig:
 
     def test_execute_with_validation_disabled(self):
         """execute() respects validate_input and validate_output config."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -249,7 +253,7 @@ class TestExecuteConfig:
 
     def test_execute_default_config(self):
         """execute() works with empty config dict."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -265,7 +269,7 @@ class TestExecuteConfig:
 
     def test_execute_missing_config_uses_defaults(self):
         """execute() works when config key is omitted entirely."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -279,12 +283,51 @@ class TestExecuteConfig:
         assert "items" in result
 
 
+class TestExecutePipeline:
+    """Tests for execute() with multi-stage pipeline config."""
+
+    def test_execute_single_stage_pipeline(self):
+        """execute() accepts a pipeline list in place of transform_id."""
+        input_file = GMAIL_INPUT
+        if not input_file.exists():
+            pytest.skip("Golden test data not available")
+
+        raw_email = json.loads(input_file.read_text())
+
+        result = execute({
+            "source_type": "email",
+            "items": [raw_email],
+            "config": {"pipeline": ["email/gmail_to_jmap_lite@1.0.0"]},
+        })
+
+        assert result["stats"]["output"] == 1
+        assert len(result["items"]) == 1
+
+    def test_execute_empty_pipeline_raises(self):
+        """execute() raises ValueError for an empty pipeline list."""
+        with pytest.raises(ValueError, match="'pipeline' must be a non-empty list"):
+            execute({
+                "source_type": "email",
+                "items": [],
+                "config": {"pipeline": []},
+            })
+
+    def test_execute_pipeline_not_list_raises(self):
+        """execute() raises ValueError if pipeline is not a list."""
+        with pytest.raises(ValueError, match="'pipeline' must be a non-empty list"):
+            execute({
+                "source_type": "email",
+                "items": [],
+                "config": {"pipeline": "email/gmail_to_jmap_lite@1.0.0"},
+            })
+
+
 class TestExecuteCallableResultSchema:
     """Tests that execute() result matches CallableResult schema."""
 
     def test_result_can_create_callable_result(self):
         """execute() result can be used to create a CallableResult."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
+        input_file = GMAIL_INPUT
         if not input_file.exists():
             pytest.skip("Golden test data not available")
 
@@ -0,0 +1,133 @@
+"""Shared pytest fixtures for the canonizer test suite.
+
+The integration and callable tests are IO-bound on the Node bridge, so
+the suite supports parallel runs via pytest-xdist (``pytest -n auto``).
+Each xdist worker is an independent process; per-worker setup that
+amortizes bridge costs across a worker's test subset lives here.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+
+import pytest
+from typer.testing import CliRunner
+
+from canonizer.core.node_bridge import get_canonizer_core_bin
+
+
+@pytest.fixture(scope="session")
+def load_json(request):
+    """Session-memoized JSON fixture loader.
+
+    Golden inputs/expected files are parsed once per session and the
+    parsed object is shared. Callers must treat the result as read-only
+    (deepcopy first if a test needs to mutate it).
+
+    Parsed fixtures are also pickled under the pytest cache directory,
+    keyed by path+mtime, so consecutive sessions skip re-tokenizing
+    unchanged files (pickle.load carries no JSON parse cost). The pickle
+    is only written when the key is new, and only for fixtures under
+    1MB - anything larger would roughly double on disk for little
+    session-to-session gain.
+    """
+    cache = getattr(request.config, "cache", None)
+    cache_dir = cache.mkdir("canonizer_fixtures") if cache is not None else None
+
+    @functools.cache
+    def _load(path: str) -> dict | list:
+        cacheable = cache_dir is not None and os.path.getsize(path) <= 1_000_000
+        if cacheable:
+            key = hashlib.sha1(f"{path}:{os.path.getmtime(path)}".encode()).hexdigest()
+            pickled = cache_dir / f"{key}.pkl"
+            if pickled.exists():
+                try:
+                    return pickle.loads(pickled.read_bytes())
+                except (pickle.UnpicklingError, EOFError):
+                    # Torn or truncated entry (xdist workers share this dir,
+                    # or a previous run was killed mid-write) - reparse.
+                    pass
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+        if cacheable:
+            # Write-then-rename so concurrent readers never see a partial file
+            tmp = pickled.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(pickle.dumps(data, protocol=5))
+            os.replace(tmp, pickled)
+        return data
+
+    return _load
+
+
+@pytest.fixture(scope="session")
+def run_golden(load_json):
+    """Execute a transform against its golden fixtures.
+
+    Returns a callable ``(runtime, transform_dir, **execute_kwargs)`` ->
+    ``(result, expected_data)`` that loads ``tests/input.json`` and
+    ``tests/expected.json`` from the transform directory through the
+    session JSON cache. Validation is off unless overridden.
+    """
+
+    def _run(runtime, transform_dir, **kwargs):
+        kwargs.setdefault("validate_input", False)
+        kwargs.setdefault("validate_output", False)
+        result = runtime.execute(
+            transform_meta_path=transform_dir / "spec.meta.yaml",
+            input_data=load_json(str(transform_dir / "tests" / "input.json")),
+            **kwargs,
+        )
+        return result, load_json(str(transform_dir / "tests" / "expected.json"))
+
+    return _run
+
+
+_EMAIL_TIMINGS = pytest.StashKey[dict]()
+
+
+@pytest.fixture
+def email_timings(request):
+    """Per-run table of email transform timings, printed at session end."""
+    return request.config.stash.setdefault(_EMAIL_TIMINGS, {})
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the aggregate email transform timing table, if populated."""
+    timings = config.stash.get(_EMAIL_TIMINGS, None)
+    if not timings:
+        return
+    terminalreporter.section("email transform execution summary")
+    for transform_id, info in sorted(timings.items()):
+        terminalreporter.write_line(
+            f"{transform_id:30s} | {info['runtime']:6s} | {info['execution_time_ms']:6.1f}ms"
+        )
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One CLI runner for the whole session.
+
+    Typer's CliRunner is stateless across invokes (each invoke gets its
+    own isolated stdio), so a single instance is safe to share.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_node_bridge():
+    """Resolve the canonizer-core binary once per (xdist) worker.
+
+    Pins the resolved path into CANONIZER_CORE_BIN so every subsequent
+    bridge invocation in this worker skips the repo-walk/PATH lookup.
+    Harmless when the binary is not built - bridge-dependent tests fail
+    or skip on their own.
+    """
+    if os.environ.get("CANONIZER_CORE_BIN"):
+        return
+
+    try:
+        os.environ["CANONIZER_CORE_BIN"] = get_canonizer_core_bin()
+    except RuntimeError:
+        pass
@@ -5,168 +5,189 @@ a registry clone into a project's .canonizer/ directory.
 """
 
 import json
-from pathlib import Path
+import os
+import shutil
+from pathlib import Path, PurePosixPath
 
 import pytest
-import yaml
-from typer.testing import CliRunner
 
 from canonizer.cli.main import app
 from canonizer.local.config import CANONIZER_DIR, LOCK_FILENAME, REGISTRY_DIR
 
-
-@pytest.fixture
-def runner():
-    """Create a CLI runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def full_mock_registry(tmp_path):
-    """Create a comprehensive mock registry for integration testing.
-
-    Mimics the structure of canonizer-registry with multiple schemas
-    and transforms across different categories.
-    """
-    registry = tmp_path / "canonizer-registry"
-    registry.mkdir()
-
-    # ================== SCHEMAS ==================
-    schemas_dir = registry / "schemas"
-
-    # com.google schemas
-    gmail_schema_dir = schemas_dir / "com.google" / "gmail_email" / "jsonschema"
-    gmail_schema_dir.mkdir(parents=True)
-    (gmail_schema_dir / "1-0-0.json").write_text(json.dumps({
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": "Gmail Email",
-        "type": "object",
-        "required": ["id"],
-        "properties": {
-            "id": {"type": "string"},
-            "threadId": {"type": "string"},
-            "snippet": {"type": "string"},
-            "payload": {"type": "object"}
-        }
-    }))
-
-    forms_schema_dir = schemas_dir / "com.google" / "forms_response" / "jsonschema"
-    forms_schema_dir.mkdir(parents=True)
-    (forms_schema_dir / "1-0-0.json").write_text(json.dumps({
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": "Google Forms Response",
-        "type": "object",
-        "required": ["responseId"],
-        "properties": {
-            "responseId": {"type": "string"},
-            "formId": {"type": "string"}
-        }
-    }))
-
-    # com.microsoft schemas
-    exchange_schema_dir = schemas_dir / "com.microsoft" / "exchange_email" / "jsonschema"
-    exchange_schema_dir.mkdir(parents=True)
-    (exchange_schema_dir / "1-0-0.json").write_text(json.dumps({
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": "Exchange Email",
-        "type": "object",
-        "required": ["id"],
-        "properties": {
-            "id": {"type": "string"},
-            "subject": {"type": ["string", "null"]}
-        }
-    }))
-
-    # org.canonical schemas
-    jmap_lite_dir = schemas_dir / "org.canonical" / "email_jmap_lite" / "jsonschema"
-    jmap_lite_dir.mkdir(parents=True)
-    (jmap_lite_dir / "1-0-0.json").write_text(json.dumps({
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": "JMAP Lite Email",
-        "type": "object",
-        "required": ["id"],
-        "properties": {
-            "id": {"type": "string"},
-            "subject": {"type": "string"},
-            "threadId": {"type": "string"}
-        }
-    }))
-
-    form_response_dir = schemas_dir / "org.canonical" / "form_response" / "jsonschema"
-    form_response_dir.mkdir(parents=True)
-    (form_response_dir / "1-0-0.json").write_text(json.dumps({
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": "Canonical Form Response",
-        "type": "object",
-        "required": ["response_id"],
-        "properties": {
-            "response_id": {"type": "string"}
-        }
-    }))
-
-    # ================== TRANSFORMS ==================
-    transforms_dir = registry / "transforms"
-
-    # email/gmail_to_jmap_lite
-    gmail_transform_dir = transforms_dir / "email" / "gmail_to_jmap_lite" / "1.0.0"
-    gmail_transform_dir.mkdir(parents=True)
-    (gmail_transform_dir / "spec.jsonata").write_text("""{
+# ================== MOCK REGISTRY CONTENT ==================
+# Serialized once at import time; the fixture only writes files.
+
+_GMAIL_SCHEMA_JSON = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Gmail Email",
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {"type": "string"},
+        "threadId": {"type": "string"},
+        "snippet": {"type": "string"},
+        "payload": {"type": "object"}
+    }
+})
+
+_FORMS_SCHEMA_JSON = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Google Forms Response",
+    "type": "object",
+    "required": ["responseId"],
+    "properties": {
+        "responseId": {"type": "string"},
+        "formId": {"type": "string"}
+    }
+})
+
+_EXCHANGE_SCHEMA_JSON = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Exchange Email",
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {"type": "string"},
+        "subject": {"type": ["string", "null"]}
+    }
+})
+
+_JMAP_LITE_SCHEMA_JSON = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "JMAP Lite Email",
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {"type": "string"},
+        "subject": {"type": "string"},
+        "threadId": {"type": "string"}
+    }
+})
+
+_FORM_RESPONSE_SCHEMA_JSON = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Canonical Form Response",
+    "type": "object",
+    "required": ["response_id"],
+    "properties": {
+        "response_id": {"type": "string"}
+    }
+})
+
+_GMAIL_JSONATA = """{
     "id": payload.id,
     "threadId": payload.threadId,
     "subject": payload.payload.headers[name="Subject"].value,
     "preview": payload.snippet
-}""")
-    (gmail_transform_dir / "spec.meta.yaml").write_text(yaml.dump({
-        "id": "email/gmail_to_jmap_lite",
-        "version": "1.0.0",
-        "engine": "jsonata",
-        "from_schema": "iglu:com.google/gmail_email/jsonschema/1-0-0",
-        "to_schema": "iglu:org.canonical/email_jmap_lite/jsonschema/1-0-0",
-        "spec_path": "spec.jsonata",
-        "status": "stable"
-    }))
-
-    # email/exchange_to_jmap_lite
-    exchange_transform_dir = transforms_dir / "email" / "exchange_to_jmap_lite" / "1.0.0"
-    exchange_transform_dir.mkdir(parents=True)
-    (exchange_transform_dir / "spec.jsonata").write_text("""{
+}"""
+
+_EXCHANGE_JSONATA = """{
     "id": id,
     "subject": subject
-}""")
-    (exchange_transform_dir / "spec.meta.yaml").write_text(yaml.dump({
-        "id": "email/exchange_to_jmap_lite",
-        "version": "1.0.0",
-        "engine": "jsonata",
-        "from_schema": "iglu:com.microsoft/exchange_email/jsonschema/1-0-0",
-        "to_schema": "iglu:org.canonical/email_jmap_lite/jsonschema/1-0-0",
-        "spec_path": "spec.jsonata",
-        "status": "stable"
-    }))
-
-    # forms/google_forms_to_canonical
-    forms_transform_dir = transforms_dir / "forms" / "google_forms_to_canonical" / "1.0.0"
-    forms_transform_dir.mkdir(parents=True)
-    (forms_transform_dir / "spec.jsonata").write_text("""{
+}"""
+
+_FORMS_JSONATA = """{
     "response_id": responseId,
     "form_id": formId
-}""")
-    (forms_transform_dir / "spec.meta.yaml").write_text(yaml.dump({
-        "id": "forms/google_forms_to_canonical",
-        "version": "1.0.0",
-        "engine": "jsonata",
-        "from_schema": "iglu:com.google/forms_response/jsonschema/1-0-0",
-        "to_schema": "iglu:org.canonical/form_response/jsonschema/1-0-0",
-        "spec_path": "spec.jsonata",
-        "status": "stable"
-    }))
+}"""
+
+_GMAIL_META_YAML = """\
+id: email/gmail_to_jmap_lite
+version: 1.0.0
+engine: jsonata
+from_schema: iglu:com.google/gmail_email/jsonschema/1-0-0
+to_schema: iglu:org.canonical/email_jmap_lite/jsonschema/1-0-0
+spec_path: spec.jsonata
+status: stable
+"""
+
+_EXCHANGE_META_YAML = """\
+id: email/exchange_to_jmap_lite
+version: 1.0.0
+engine: jsonata
+from_schema: iglu:com.microsoft/exchange_email/jsonschema/1-0-0
+to_schema: iglu:org.canonical/email_jmap_lite/jsonschema/1-0-0
+spec_path: spec.jsonata
+status: stable
+"""
+
+_FORMS_META_YAML = """\
+id: forms/google_forms_to_canonical
+version: 1.0.0
+engine: jsonata
+from_schema: iglu:com.google/forms_response/jsonschema/1-0-0
+to_schema: iglu:org.canonical/form_response/jsonschema/1-0-0
+spec_path: spec.jsonata
+status: stable
+"""
+
+# Frequently asserted transform dirs, built once instead of per assertion
+GMAIL_TRANSFORM_DIR = PurePosixPath("transforms/email/gmail_to_jmap_lite/1.0.0")
+EXCHANGE_TRANSFORM_DIR = PurePosixPath("transforms/email/exchange_to_jmap_lite/1.0.0")
+FORMS_TRANSFORM_DIR = PurePosixPath("transforms/forms/google_forms_to_canonical/1.0.0")
+
+# Declarative (relative path, content) table driving the fixture below
+_REGISTRY_FILES = [
+    ("schemas/com.google/gmail_email/jsonschema/1-0-0.json", _GMAIL_SCHEMA_JSON),
+    ("schemas/com.google/forms_response/jsonschema/1-0-0.json", _FORMS_SCHEMA_JSON),
+    ("schemas/com.microsoft/exchange_email/jsonschema/1-0-0.json", _EXCHANGE_SCHEMA_JSON),
+    ("schemas/org.canonical/email_jmap_lite/jsonschema/1-0-0.json", _JMAP_LITE_SCHEMA_JSON),
+    ("schemas/org.canonical/form_response/jsonschema/1-0-0.json", _FORM_RESPONSE_SCHEMA_JSON),
+    ("transforms/email/gmail_to_jmap_lite/1.0.0/spec.jsonata", _GMAIL_JSONATA),
+    ("transforms/email/gmail_to_jmap_lite/1.0.0/spec.meta.yaml", _GMAIL_META_YAML),
+    ("transforms/email/exchange_to_jmap_lite/1.0.0/spec.jsonata", _EXCHANGE_JSONATA),
+    ("transforms/email/exchange_to_jmap_lite/1.0.0/spec.meta.yaml", _EXCHANGE_META_YAML),
+    ("transforms/forms/google_forms_to_canonical/1.0.0/spec.jsonata", _FORMS_JSONATA),
+    ("transforms/forms/google_forms_to_canonical/1.0.0/spec.meta.yaml", _FORMS_META_YAML),
+]
+
+
+def assert_tree_contains(root, rel_paths):
+    """Assert every relative path exists under root.
+
+    Groups paths by parent and lists each parent with one scandir call
+    instead of one stat() per path.
+    """
+    by_parent = {}
+    for rel in rel_paths:
+        full = root / rel
+        by_parent.setdefault(full.parent, set()).add(full.name)
+
+    for parent, names in by_parent.items():
+        try:
+            present = {entry.name for entry in os.scandir(parent)}
+        except FileNotFoundError:
+            pytest.fail(f"Missing directory: {parent}")
+        missing = names - present
+        assert not missing, f"Missing under {parent}: {sorted(missing)}"
+
+
+@pytest.fixture(scope="session")
+def full_mock_registry(tmp_path_factory):
+    """Create a comprehensive mock registry for integration testing.
+
+    Mimics the structure of canonizer-registry with multiple schemas
+    and transforms across different categories. Content comes from the
+    module-level _REGISTRY_FILES table, so serialization happens once
+    per interpreter and setup is a flat write loop.
+
+    Session-scoped: built once for the whole run. Tests that mutate the
+    registry must copy it into their own tmp_path first.
+    """
+    registry = tmp_path_factory.mktemp("canonizer-registry")
+
+    for rel, content in _REGISTRY_FILES:
+        path = registry / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
 
     return registry
 
 
-@pytest.fixture
-def initialized_project(tmp_path, runner):
-    """Create an initialized project with .canonizer/."""
-    project = tmp_path / "test_project"
+@pytest.fixture(scope="session")
+def _pristine_project(tmp_path_factory, runner):
+    """Run `can init` exactly once for the whole session."""
+    project = tmp_path_factory.mktemp("pristine") / "test_project"
     project.mkdir()
 
     result = runner.invoke(app, ["init", str(project)])
@@ -175,6 +196,19 @@ def initialized_project(tmp_path, runner):
     return project
 
 
+@pytest.fixture
+def initialized_project(tmp_path, _pristine_project):
+    """Create an initialized project with .canonizer/.
+
+    Copies the pristine session project instead of re-running init,
+    which is much cheaper than a full CLI bootstrap per test.
+    """
+    project = tmp_path / "test_project"
+    shutil.copytree(_pristine_project, project)
+    return project
+
+
+@pytest.mark.slow
 class TestBulkImportIntegration:
     """Integration tests for the bulk import workflow."""
 
@@ -189,28 +223,14 @@ class TestBulkImportIntegration:
 
         assert result.exit_code == 0, f"Import failed: {result.stdout}"
 
-        # Verify schemas were imported
+        # Verify every schema and transform file landed; the fixture table
+        # already enumerates the full expected tree
         registry_path = initialized_project / CANONIZER_DIR / REGISTRY_DIR
-        schemas_path = registry_path / "schemas"
-
-        assert (schemas_path / "com.google" / "gmail_email" / "jsonschema" / "1-0-0.json").exists()
-        assert (schemas_path / "com.google" / "forms_response" / "jsonschema" / "1-0-0.json").exists()
-        assert (schemas_path / "com.microsoft" / "exchange_email" / "jsonschema" / "1-0-0.json").exists()
-        assert (schemas_path / "org.canonical" / "email_jmap_lite" / "jsonschema" / "1-0-0.json").exists()
-        assert (schemas_path / "org.canonical" / "form_response" / "jsonschema" / "1-0-0.json").exists()
-
-        # Verify transforms were imported
-        transforms_path = registry_path / "transforms"
-
-        assert (transforms_path / "email" / "gmail_to_jmap_lite" / "1.0.0" / "spec.jsonata").exists()
-        assert (transforms_path / "email" / "gmail_to_jmap_lite" / "1.0.0" / "spec.meta.yaml").exists()
-        assert (transforms_path / "email" / "exchange_to_jmap_lite" / "1.0.0" / "spec.jsonata").exists()
-        assert (transforms_path / "forms" / "google_forms_to_canonical" / "1.0.0" / "spec.jsonata").exists()
+        assert_tree_contains(registry_path, [rel for rel, _ in _REGISTRY_FILES])
 
         # Verify lock file was updated
         lock_path = initialized_project / CANONIZER_DIR / LOCK_FILENAME
-        with open(lock_path) as f:
-            lock = json.load(f)
+        lock = json.loads(lock_path.read_bytes())
 
         assert len(lock["schemas"]) == 5
         assert len(lock["transforms"]) == 3
@@ -239,16 +259,15 @@ class TestBulkImportIntegration:
         transforms_path = registry_path / "transforms"
 
         # Email transforms should exist
-        assert (transforms_path / "email" / "gmail_to_jmap_lite" / "1.0.0").exists()
-        assert (transforms_path / "email" / "exchange_to_jmap_lite" / "1.0.0").exists()
+        assert (registry_path / GMAIL_TRANSFORM_DIR).exists()
+        assert (registry_path / EXCHANGE_TRANSFORM_DIR).exists()
 
         # Forms transforms should NOT exist
         assert not (transforms_path / "forms").exists()
 
         # But all schemas should still be imported
         lock_path = initialized_project / CANONIZER_DIR / LOCK_FILENAME
-        with open(lock_path) as f:
-            lock = json.load(f)
+        lock = json.loads(lock_path.read_bytes())
 
         assert len(lock["schemas"]) == 5  # All schemas
         assert len(lock["transforms"]) == 2  # Only email transforms
@@ -268,15 +287,14 @@ class TestBulkImportIntegration:
         registry_path = initialized_project / CANONIZER_DIR / REGISTRY_DIR
 
         # Forms transform should exist
-        assert (registry_path / "transforms" / "forms" / "google_forms_to_canonical" / "1.0.0").exists()
+        assert (registry_path / FORMS_TRANSFORM_DIR).exists()
 
         # Email transforms should NOT exist
         assert not (registry_path / "transforms" / "email").exists()
 
         # Lock file should show form transform
         lock_path = initialized_project / CANONIZER_DIR / LOCK_FILENAME
-        with open(lock_path) as f:
-            lock = json.load(f)
+        lock = json.loads(lock_path.read_bytes())
 
         assert len(lock["transforms"]) == 1
         assert "forms/google_forms_to_canonical@1.0.0" in lock["transforms"]
@@ -306,24 +324,27 @@ class TestBulkImportIntegration:
 
         # Lock should have schemas but no transforms
         lock_path = initialized_project / CANONIZER_DIR / LOCK_FILENAME
-        with open(lock_path) as f:
-            lock = json.load(f)
+        lock = json.loads(lock_path.read_bytes())
 
         assert len(lock["schemas"]) == 5
         assert len(lock["transforms"]) == 0
 
-    def test_re_import_updates_existing(self, runner, full_mock_registry, initialized_project):
+    def test_re_import_updates_existing(self, runner, full_mock_registry, initialized_project, tmp_path):
         """Test that re-importing updates existing files."""
+        # This test mutates the source registry, so work on a private copy
+        registry = tmp_path / "registry_copy"
+        shutil.copytree(full_mock_registry, registry)
+
         # First import
         result1 = runner.invoke(app, [
             "import", "all",
-            "--from", str(full_mock_registry),
+            "--from", str(registry),
             "--to", str(initialized_project),
         ])
         assert result1.exit_code == 0
 
         # Modify a schema in the source registry
-        gmail_schema = full_mock_registry / "schemas" / "com.google" / "gmail_email" / "jsonschema" / "1-0-0.json"
+        gmail_schema = registry / "schemas" / "com.google" / "gmail_email" / "jsonschema" / "1-0-0.json"
         modified_schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
             "title": "Gmail Email - Modified",
@@ -339,20 +360,20 @@ class TestBulkImportIntegration:
         # Re-import
         result2 = runner.invoke(app, [
             "import", "all",
-            "--from", str(full_mock_registry),
+            "--from", str(registry),
             "--to", str(initialized_project),
         ])
         assert result2.exit_code == 0
 
         # Verify the local copy was updated
         local_schema = initialized_project / CANONIZER_DIR / REGISTRY_DIR / "schemas" / "com.google" / "gmail_email" / "jsonschema" / "1-0-0.json"
-        with open(local_schema) as f:
-            schema = json.load(f)
+        schema = json.loads(local_schema.read_bytes())
 
         assert schema["title"] == "Gmail Email - Modified"
         assert "newField" in schema["properties"]
 
 
+@pytest.mark.slow
 class TestImportFromRealRegistry:
     """Tests that use the actual canonizer schemas directory if available."""
 
@@ -379,8 +400,7 @@ class TestImportFromRealRegistry:
         # May have partial failures due to non-standard schema names
         # Check that we imported at least some schemas
         lock_path = initialized_project / CANONIZER_DIR / LOCK_FILENAME
-        with open(lock_path) as f:
-            lock = json.load(f)
+        lock = json.loads(lock_path.read_bytes())
 
         assert len(lock["schemas"]) > 0, "Should have imported at least one schema"
         # Verify at least the standard schemas were imported
@@ -3,7 +3,6 @@
 Tests that each transform's input.json → expected.json works correctly.
 """
 
-import json
 from pathlib import Path
 
 import pytest
@@ -11,28 +10,44 @@ import pytest
 from canonizer.core.runtime import TransformRuntime
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_root():
     """Return path to project root directory."""
     return Path(__file__).parent.parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schemas_dir(project_root):
     """Return path to schemas directory."""
     return project_root / "schemas"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def transforms_dir(project_root):
     """Return path to transforms directory."""
     return project_root / "transforms" / "email"
 
 
-@pytest.fixture
-def runtime(schemas_dir):
-    """Create TransformRuntime instance."""
-    return TransformRuntime(schemas_dir=schemas_dir)
+@pytest.fixture(scope="session")
+def runtime(schemas_dir, transforms_dir):
+    """Create one TransformRuntime for the whole session.
+
+    The runtime is stateless across execute() calls, so schema loading is
+    paid once per session instead of once per test. A throwaway warmup
+    execute absorbs first-spawn costs (binary resolution, OS caches) so
+    execution_time_ms in real tests reflects transform time.
+    """
+    rt = TransformRuntime(schemas_dir=schemas_dir)
+    try:
+        rt.execute(
+            transform_meta_path=transforms_dir / "gmail_to_jmap_minimal" / "1.0.0" / "spec.meta.yaml",
+            input_data={},
+            validate_input=False,
+            validate_output=False,
+        )
+    except Exception:
+        pass  # bridge unavailable or input rejected; tests report on their own
+    return rt
 
 
 # List of all 6 email transforms
@@ -47,7 +62,7 @@ TRANSFORMS = [
 
 
 @pytest.mark.parametrize("transform_id", TRANSFORMS)
-def test_golden_file_transform(runtime, transforms_dir, transform_id):
+def test_golden_file_transform(runtime, transforms_dir, transform_id, load_json):
     """Test transform using golden test files (input.json → expected.json)."""
     transform_dir = transforms_dir / transform_id / "1.0.0"
     transform_meta = transform_dir / "spec.meta.yaml"
@@ -55,11 +70,8 @@ def test_golden_file_transform(runtime, transforms_dir, transform_id):
     expected_file = transform_dir / "tests" / "expected.json"
 
     # Load input and expected output
-    with open(input_file) as f:
-        input_data = json.load(f)
-
-    with open(expected_file) as f:
-        expected_data = json.load(f)
+    input_data = load_json(str(input_file))
+    expected_data = load_json(str(expected_file))
 
     # Execute transform WITHOUT validation (transforms may have minor differences)
     result = runtime.execute(
@@ -80,44 +92,29 @@ def test_golden_file_transform(runtime, transforms_dir, transform_id):
     # Print summary for debugging
     print(f"\n{transform_id}: ✓ Transform executed successfully")
     print(f"  Runtime: {result.runtime}, Time: {result.execution_time_ms:.2f}ms")
-    print(f"  Output size: {len(json.dumps(result.data))} bytes")
 
 
-def test_all_transforms_execute_successfully(runtime, transforms_dir):
-    """Summary test: Verify all 6 transforms can execute without errors."""
-    results = {}
+@pytest.mark.parametrize("transform_id", TRANSFORMS)
+def test_transform_executes(runtime, transforms_dir, transform_id, load_json, email_timings):
+    """Each transform executes without errors; timings print at session end.
 
-    for transform_id in TRANSFORMS:
-        transform_dir = transforms_dir / transform_id / "1.0.0"
-        transform_meta = transform_dir / "spec.meta.yaml"
-        input_file = transform_dir / "tests" / "input.json"
+    Parametrized (rather than one serial loop) so xdist can distribute
+    the Node-bound executions across workers.
+    """
+    transform_dir = transforms_dir / transform_id / "1.0.0"
+    transform_meta = transform_dir / "spec.meta.yaml"
+    input_file = transform_dir / "tests" / "input.json"
 
-        with open(input_file) as f:
-            input_data = json.load(f)
+    input_data = load_json(str(input_file))
 
-        result = runtime.execute(
-            transform_meta_path=transform_meta,
-            input_data=input_data,
-            validate_input=False,
-            validate_output=False,
-        )
+    result = runtime.execute(
+        transform_meta_path=transform_meta,
+        input_data=input_data,
+        validate_input=False,
+        validate_output=False,
+    )
 
-        results[transform_id] = {
-            "success": True,
-            "runtime": result.runtime,
-            "execution_time_ms": result.execution_time_ms,
-            "output_size": len(json.dumps(result.data)),
-        }
-
-    # Verify all 6 transforms succeeded
-    assert len(results) == 6
-
-    print("\n" + "=" * 80)
-    print("EMAIL TRANSFORM EXECUTION SUMMARY")
-    print("=" * 80)
-    for transform_id, info in results.items():
-        print(f"{transform_id:30s} | {info['runtime']:6s} | "
-              f"{info['execution_time_ms']:6.1f}ms | {info['output_size']:7d} bytes")
-    print("=" * 80)
-    print(f"Total: {len(results)}/6 transforms executed successfully")
-    print("=" * 80)
+    email_timings[transform_id] = {
+        "runtime": result.runtime,
+        "execution_time_ms": result.execution_time_ms,
+    }
@@ -8,138 +8,252 @@ Tests all 6 email transforms (Gmail + Exchange → JMAP Full/Lite/Minimal):
 - Attachment handling
 """
 
-import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
 from canonizer.core.runtime import TransformRuntime
-from canonizer.core.validator import ValidationError
+from canonizer.core.validator import ErrorCode, ValidationError
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_root():
     """Return path to project root directory."""
     return Path(__file__).parent.parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schemas_dir(project_root):
     """Return path to schemas directory."""
     return project_root / "schemas"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def transforms_dir(project_root):
     """Return path to transforms directory."""
     return project_root / "transforms" / "email"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir(project_root):
     """Return path to test fixtures directory."""
     return project_root / "tests" / "fixtures" / "email"
 
 
-@pytest.fixture
-def runtime(schemas_dir):
-    """Create TransformRuntime instance."""
-    return TransformRuntime(schemas_dir=schemas_dir)
+@pytest.fixture(scope="session")
+def runtime(schemas_dir, transforms_dir):
+    """Create one TransformRuntime for the whole session.
+
+    The runtime is stateless across execute() calls, so schema loading is
+    paid once per session instead of once per test. A throwaway warmup
+    execute absorbs first-spawn costs (binary resolution, OS caches) so
+    execution_time_ms in real tests reflects transform time.
+    """
+    rt = TransformRuntime(schemas_dir=schemas_dir)
+    try:
+        rt.execute(
+            transform_meta_path=transforms_dir / "gmail_to_jmap_minimal" / "1.0.0" / "spec.meta.yaml",
+            input_data={},
+            validate_input=False,
+            validate_output=False,
+        )
+    except Exception:
+        pass  # bridge unavailable or input rejected; tests report on their own
+    return rt
+
+
+# Compiled once; normalizes any fractional-zero suffix (.0Z, .000Z, ...)
+_TS_NORM = re.compile(r"\.0+Z$")
+
+
+def _norm_ts(value):
+    """Normalize an ISO timestamp by dropping a zero fractional part."""
+    return _TS_NORM.sub("Z", value)
+
+
+# Inline fixtures hoisted to module constants so they are built once at
+# import time rather than per test invocation. Read-only.
+INPUT_WITH_ATTACHMENTS = {
+    "id": "test123",
+    "threadId": "thread123",
+    "labelIds": ["INBOX"],
+    "snippet": "Test with attachment",
+    "internalDate": "1699564800000",
+    "payload": {
+        "mimeType": "multipart/mixed",
+        "headers": [
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+            {"name": "Subject", "value": "Test with attachment"},
+            {"name": "Date", "value": "Thu, 9 Nov 2023 12:00:00 -0800"},
+            {"name": "Message-ID", "value": "<test123@example.com>"}
+        ],
+        "parts": [
+            {
+                "partId": "0",
+                "mimeType": "text/plain",
+                "body": {
+                    "size": 13,
+                    "data": "SGVsbG8gV29ybGQh"  # "Hello World!" in base64
+                }
+            },
+            {
+                "partId": "1",
+                "mimeType": "application/pdf",
+                "filename": "document.pdf",
+                "body": {
+                    "attachmentId": "ANGjdJ8w",
+                    "size": 102400
+                }
+            }
+        ]
+    }
+}
+
+# Shared read-only base for inline Exchange payloads; tests override the
+# fields they care about with {**BASE_EXCHANGE_INPUT, ...}.
+BASE_EXCHANGE_INPUT = MappingProxyType({
+    "id": "test123",
+    "conversationId": "conv123",
+    "subject": "Test",
+    "bodyPreview": "Preview",
+    "from": {"emailAddress": {"name": "Sender", "address": "sender@example.com"}},
+    "toRecipients": [{"emailAddress": {"name": "Recipient", "address": "recipient@example.com"}}],
+    "sentDateTime": "2023-11-09T20:00:00Z",
+    "receivedDateTime": "2023-11-09T20:00:15Z",
+    "body": {"contentType": "text", "content": "Test"},
+    "internetMessageId": "<test@example.com>",
+    "internetMessageHeaders": [],
+})
+
+_LONG_SUBJECT = "A" * 10000  # 10KB subject line
+
+MANY_RECIPIENTS = [
+    {"emailAddress": {"name": f"User{i}", "address": f"user{i}@example.com"}}
+    for i in range(100)
+]
+
+INPUT_MULTIPART_ALTERNATIVE = {
+    "id": "test456",
+    "threadId": "thread456",
+    "labelIds": ["INBOX"],
+    "snippet": "Test multipart",
+    "internalDate": "1699564800000",
+    "payload": {
+        "mimeType": "multipart/alternative",
+        "headers": [
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+            {"name": "Subject", "value": "Test Multipart"},
+            {"name": "Date", "value": "Thu, 9 Nov 2023 12:00:00 -0800"},
+            {"name": "Message-ID", "value": "<test456@example.com>"}
+        ],
+        "parts": [
+            {
+                "partId": "0",
+                "mimeType": "text/plain",
+                "body": {
+                    "size": 10,
+                    "data": "VGV4dCBib2R5"  # "Text body" in base64
+                }
+            },
+            {
+                "partId": "1",
+                "mimeType": "text/html",
+                "body": {
+                    "size": 20,
+                    "data": "PGh0bWw-SFRNTCBib2R5PC9odG1sPg=="  # "<html>HTML body</html>"
+                }
+            }
+        ]
+    }
+}
 
 
 # ============================================================================
-# Gmail → JMAP Full Tests
+# End-to-End Tests (all six transforms)
 # ============================================================================
 
 
-def test_gmail_to_jmap_full_end_to_end(runtime, transforms_dir, fixtures_dir):
-    """Test Gmail → JMAP Full transform end-to-end with validation."""
-    transform_meta = transforms_dir / "gmail_to_jmap_full" / "1.0.0" / "spec.meta.yaml"
-    input_file = transforms_dir / "gmail_to_jmap_full" / "1.0.0" / "tests" / "input.json"
-    expected_file = transforms_dir / "gmail_to_jmap_full" / "1.0.0" / "tests" / "expected.json"
+TRANSFORMS = [
+    "gmail_to_jmap_full",
+    "gmail_to_jmap_lite",
+    "gmail_to_jmap_minimal",
+    "exchange_to_jmap_full",
+    "exchange_to_jmap_lite",
+    "exchange_to_jmap_minimal",
+]
+
+
+def _assert_full(data, expected):
+    """Full format: addresses, bodyStructure, and bodyValues present."""
+    assert data["from"] == expected["from"]
+    assert data["to"] == expected["to"]
+    assert data["bodyStructure"] is not None
+    assert len(data["bodyValues"]) > 0
+
+
+def _assert_lite(data, expected):
+    """Lite format: inline body dict, no bodyStructure."""
+    assert isinstance(data["body"], dict)
+    assert "text" in data["body"] or "html" in data["body"]
+    assert "bodyStructure" not in data
+
 
-    with open(input_file) as f:
-        input_data = json.load(f)
+def _assert_minimal(data, expected):
+    """Minimal format: metadata only, blobId references the body."""
+    assert data["from"] == expected["from"]
+    assert "body" not in data
+    assert "bodyStructure" not in data
+    assert "bodyValues" not in data
+    assert data["blobId"] is not None
 
-    with open(expected_file) as f:
-        expected_data = json.load(f)
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
+FORMAT_ASSERTIONS = {
+    "full": _assert_full,
+    "lite": _assert_lite,
+    "minimal": _assert_minimal,
+}
+
+
+@pytest.mark.parametrize("transform_id", TRANSFORMS)
+def test_transform_end_to_end(runtime, transforms_dir, run_golden, transform_id):
+    """End-to-end with validation; format shape asserts come from FORMAT_ASSERTIONS."""
+    result, expected_data = run_golden(
+        runtime,
+        transforms_dir / transform_id / "1.0.0",
         validate_input=True,
         validate_output=True,
     )
 
-    # Verify core fields match expected
+    # Core fields common to every JMAP format
     assert result.data["id"] == expected_data["id"]
     assert result.data["subject"] == expected_data["subject"]
-    assert result.data["from"] == expected_data["from"]
-    assert result.data["to"] == expected_data["to"]
     # Normalize timestamp comparison (ignore millisecond precision differences)
-    assert result.data["sentAt"].replace(".000Z", "Z") == expected_data["sentAt"].replace(".000Z", "Z")
-
-    # Verify bodyStructure exists (Full format)
-    assert "bodyStructure" in result.data
-    assert result.data["bodyStructure"] is not None
+    assert _norm_ts(result.data["sentAt"]) == _norm_ts(expected_data["sentAt"])
 
-    # Verify bodyValues exists
-    assert "bodyValues" in result.data
-    assert len(result.data["bodyValues"]) > 0
+    # Format-specific shape
+    FORMAT_ASSERTIONS[transform_id.rsplit("_", 1)[-1]](result.data, expected_data)
 
     # Verify execution metadata
     assert result.runtime == "node"
     assert result.execution_time_ms > 0
 
 
+# ============================================================================
+# Gmail → JMAP Full Tests
+# ============================================================================
+
+
+
 def test_gmail_to_jmap_full_with_attachments(runtime, transforms_dir):
     """Test Gmail → JMAP Full with email containing attachments."""
     transform_meta = transforms_dir / "gmail_to_jmap_full" / "1.0.0" / "spec.meta.yaml"
 
-    # Gmail message with attachment
-    input_data = {
-        "id": "test123",
-        "threadId": "thread123",
-        "labelIds": ["INBOX"],
-        "snippet": "Test with attachment",
-        "internalDate": "1699564800000",
-        "payload": {
-            "mimeType": "multipart/mixed",
-            "headers": [
-                {"name": "From", "value": "sender@example.com"},
-                {"name": "To", "value": "recipient@example.com"},
-                {"name": "Subject", "value": "Test with attachment"},
-                {"name": "Date", "value": "Thu, 9 Nov 2023 12:00:00 -0800"},
-                {"name": "Message-ID", "value": "<test123@example.com>"}
-            ],
-            "parts": [
-                {
-                    "partId": "0",
-                    "mimeType": "text/plain",
-                    "body": {
-                        "size": 13,
-                        "data": "SGVsbG8gV29ybGQh"  # "Hello World!" in base64
-                    }
-                },
-                {
-                    "partId": "1",
-                    "mimeType": "application/pdf",
-                    "filename": "document.pdf",
-                    "body": {
-                        "attachmentId": "ANGjdJ8w",
-                        "size": 102400
-                    }
-                }
-            ]
-        }
-    }
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, INPUT_WITH_ATTACHMENTS)
 
     # Verify attachments array exists
     assert "attachments" in result.data
@@ -153,48 +267,7 @@ def test_gmail_to_jmap_full_multipart_alternative(runtime, transforms_dir):
     """Test Gmail → JMAP Full with multipart/alternative (text + HTML)."""
     transform_meta = transforms_dir / "gmail_to_jmap_full" / "1.0.0" / "spec.meta.yaml"
 
-    input_data = {
-        "id": "test456",
-        "threadId": "thread456",
-        "labelIds": ["INBOX"],
-        "snippet": "Test multipart",
-        "internalDate": "1699564800000",
-        "payload": {
-            "mimeType": "multipart/alternative",
-            "headers": [
-                {"name": "From", "value": "sender@example.com"},
-                {"name": "To", "value": "recipient@example.com"},
-                {"name": "Subject", "value": "Test Multipart"},
-                {"name": "Date", "value": "Thu, 9 Nov 2023 12:00:00 -0800"},
-                {"name": "Message-ID", "value": "<test456@example.com>"}
-            ],
-            "parts": [
-                {
-                    "partId": "0",
-                    "mimeType": "text/plain",
-                    "body": {
-                        "size": 10,
-                        "data": "VGV4dCBib2R5"  # "Text body" in base64
-                    }
-                },
-                {
-                    "partId": "1",
-                    "mimeType": "text/html",
-                    "body": {
-                        "size": 20,
-                        "data": "PGh0bWw-SFRNTCBib2R5PC9odG1sPg=="  # "<html>HTML body</html>"
-                    }
-                }
-            ]
-        }
-    }
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, INPUT_MULTIPART_ALTERNATIVE)
 
     # Verify both text and HTML parts exist
     assert len(result.data["textBody"]) >= 1
@@ -208,37 +281,6 @@ def test_gmail_to_jmap_full_multipart_alternative(runtime, transforms_dir):
 # ============================================================================
 
 
-def test_gmail_to_jmap_lite_end_to_end(runtime, transforms_dir):
-    """Test Gmail → JMAP Lite transform end-to-end."""
-    transform_meta = transforms_dir / "gmail_to_jmap_lite" / "1.0.0" / "spec.meta.yaml"
-    input_file = transforms_dir / "gmail_to_jmap_lite" / "1.0.0" / "tests" / "input.json"
-    expected_file = transforms_dir / "gmail_to_jmap_lite" / "1.0.0" / "tests" / "expected.json"
-
-    with open(input_file) as f:
-        input_data = json.load(f)
-
-    with open(expected_file) as f:
-        expected_data = json.load(f)
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
-
-    # Verify core fields
-    assert result.data["id"] == expected_data["id"]
-    assert result.data["subject"] == expected_data["subject"]
-
-    # Verify Lite format has inline body (not bodyStructure)
-    assert "body" in result.data
-    assert isinstance(result.data["body"], dict)
-    assert "text" in result.data["body"] or "html" in result.data["body"]
-
-    # Verify NO bodyStructure (Lite format)
-    assert "bodyStructure" not in result.data
-
 
 def test_gmail_to_jmap_lite_utf8_handling(runtime, transforms_dir):
     """Test Gmail → JMAP Lite with UTF-8 and special characters."""
@@ -266,12 +308,7 @@ def test_gmail_to_jmap_lite_utf8_handling(runtime, transforms_dir):
         }
     }
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, input_data)
 
     # Verify UTF-8 characters preserved
     assert "José García" in result.data["from"][0]["name"]
@@ -285,105 +322,27 @@ def test_gmail_to_jmap_lite_utf8_handling(runtime, transforms_dir):
 # ============================================================================
 
 
-def test_gmail_to_jmap_minimal_end_to_end(runtime, transforms_dir):
-    """Test Gmail → JMAP Minimal transform end-to-end."""
-    transform_meta = transforms_dir / "gmail_to_jmap_minimal" / "1.0.0" / "spec.meta.yaml"
-    input_file = transforms_dir / "gmail_to_jmap_minimal" / "1.0.0" / "tests" / "input.json"
-    expected_file = transforms_dir / "gmail_to_jmap_minimal" / "1.0.0" / "tests" / "expected.json"
-
-    with open(input_file) as f:
-        input_data = json.load(f)
-
-    with open(expected_file) as f:
-        expected_data = json.load(f)
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
-
-    # Verify core metadata fields
-    assert result.data["id"] == expected_data["id"]
-    assert result.data["subject"] == expected_data["subject"]
-    assert result.data["from"] == expected_data["from"]
-
-    # Verify NO body content (Minimal format)
-    assert "body" not in result.data
-    assert "bodyStructure" not in result.data
-    assert "bodyValues" not in result.data
-
-    # Verify blobId exists for external body reference
-    assert "blobId" in result.data
-    assert result.data["blobId"] is not None
-
-
 # ============================================================================
 # Exchange → JMAP Full Tests
 # ============================================================================
 
 
-def test_exchange_to_jmap_full_end_to_end(runtime, transforms_dir):
-    """Test Exchange → JMAP Full transform end-to-end."""
-    transform_meta = transforms_dir / "exchange_to_jmap_full" / "1.0.0" / "spec.meta.yaml"
-    input_file = transforms_dir / "exchange_to_jmap_full" / "1.0.0" / "tests" / "input.json"
-    expected_file = transforms_dir / "exchange_to_jmap_full" / "1.0.0" / "tests" / "expected.json"
-
-    with open(input_file) as f:
-        input_data = json.load(f)
-
-    with open(expected_file) as f:
-        expected_data = json.load(f)
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
-
-    # Verify core fields
-    assert result.data["id"] == expected_data["id"]
-    assert result.data["subject"] == expected_data["subject"]
-    assert result.data["from"] == expected_data["from"]
-    assert result.data["to"] == expected_data["to"]
-
-    # Verify Full format fields
-    assert "bodyStructure" in result.data
-    assert "bodyValues" in result.data
-
 
 def test_exchange_to_jmap_full_with_categories(runtime, transforms_dir):
     """Test Exchange → JMAP Full with categories and flags."""
     transform_meta = transforms_dir / "exchange_to_jmap_full" / "1.0.0" / "spec.meta.yaml"
 
     input_data = {
+        **BASE_EXCHANGE_INPUT,
         "id": "exchange_test",
         "conversationId": "AAQkAGI2TAABj5P2QAAA=",
         "subject": "Test Categories",
         "bodyPreview": "Test",
-        "from": {
-            "emailAddress": {
-                "name": "Test User",
-                "address": "test@example.com"
-            }
-        },
-        "toRecipients": [
-            {
-                "emailAddress": {
-                    "name": "Recipient",
-                    "address": "recipient@example.com"
-                }
-            }
-        ],
-        "sentDateTime": "2023-11-09T20:00:00Z",
-        "receivedDateTime": "2023-11-09T20:00:15Z",
+        "from": {"emailAddress": {"name": "Test User", "address": "test@example.com"}},
         "body": {
             "contentType": "html",
             "content": "<html><body>Test</body></html>"
         },
-        "internetMessageId": "<test@example.com>",
         "internetMessageHeaders": [
             {"name": "From", "value": "test@example.com"},
             {"name": "To", "value": "recipient@example.com"}
@@ -397,12 +356,7 @@ def test_exchange_to_jmap_full_with_categories(runtime, transforms_dir):
         "categories": ["Work", "Important", "Follow-up"]
     }
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, input_data)
 
     # Verify flags mapped to keywords
     assert result.data["keywords"]["$seen"] is True
@@ -419,34 +373,6 @@ def test_exchange_to_jmap_full_with_categories(runtime, transforms_dir):
 # ============================================================================
 
 
-def test_exchange_to_jmap_lite_end_to_end(runtime, transforms_dir):
-    """Test Exchange → JMAP Lite transform end-to-end."""
-    transform_meta = transforms_dir / "exchange_to_jmap_lite" / "1.0.0" / "spec.meta.yaml"
-    input_file = transforms_dir / "exchange_to_jmap_lite" / "1.0.0" / "tests" / "input.json"
-    expected_file = transforms_dir / "exchange_to_jmap_lite" / "1.0.0" / "tests" / "expected.json"
-
-    with open(input_file) as f:
-        input_data = json.load(f)
-
-    with open(expected_file) as f:
-        expected_data = json.load(f)
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
-
-    # Verify core fields
-    assert result.data["id"] == expected_data["id"]
-    assert result.data["subject"] == expected_data["subject"]
-
-    # Verify Lite format
-    assert "body" in result.data
-    assert isinstance(result.data["body"], dict)
-    assert "bodyStructure" not in result.data
-
 
 def test_exchange_to_jmap_lite_html_vs_text(runtime, transforms_dir):
     """Test Exchange → JMAP Lite with both text and HTML bodies."""
@@ -454,28 +380,17 @@ def test_exchange_to_jmap_lite_html_vs_text(runtime, transforms_dir):
 
     # Test with HTML body
     input_html = {
+        **BASE_EXCHANGE_INPUT,
         "id": "html_test",
-        "conversationId": "conv123",
         "subject": "HTML Test",
-        "bodyPreview": "Preview",
-        "from": {"emailAddress": {"name": "Sender", "address": "sender@example.com"}},
-        "toRecipients": [{"emailAddress": {"name": "Recipient", "address": "recipient@example.com"}}],
-        "sentDateTime": "2023-11-09T20:00:00Z",
-        "receivedDateTime": "2023-11-09T20:00:15Z",
         "body": {
             "contentType": "html",
             "content": "<html><body><p>HTML content</p></body></html>"
         },
         "internetMessageId": "<html_test@example.com>",
-        "internetMessageHeaders": []
     }
 
-    result_html = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_html,
-        validate_input=True,
-        validate_output=True,
-    )
+    result_html = runtime.run(transform_meta, input_html)
 
     assert "html" in result_html.data["body"]
     assert "HTML content" in result_html.data["body"]["html"]
@@ -490,12 +405,7 @@ def test_exchange_to_jmap_lite_html_vs_text(runtime, transforms_dir):
         }
     }
 
-    result_text = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_text,
-        validate_input=True,
-        validate_output=True,
-    )
+    result_text = runtime.run(transform_meta, input_text)
 
     assert "text" in result_text.data["body"]
     assert "Plain text content" in result_text.data["body"]["text"]
@@ -506,37 +416,6 @@ def test_exchange_to_jmap_lite_html_vs_text(runtime, transforms_dir):
 # ============================================================================
 
 
-def test_exchange_to_jmap_minimal_end_to_end(runtime, transforms_dir):
-    """Test Exchange → JMAP Minimal transform end-to-end."""
-    transform_meta = transforms_dir / "exchange_to_jmap_minimal" / "1.0.0" / "spec.meta.yaml"
-    input_file = transforms_dir / "exchange_to_jmap_minimal" / "1.0.0" / "tests" / "input.json"
-    expected_file = transforms_dir / "exchange_to_jmap_minimal" / "1.0.0" / "tests" / "expected.json"
-
-    with open(input_file) as f:
-        input_data = json.load(f)
-
-    with open(expected_file) as f:
-        expected_data = json.load(f)
-
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
-
-    # Verify metadata only
-    assert result.data["id"] == expected_data["id"]
-    assert result.data["subject"] == expected_data["subject"]
-
-    # Verify NO body content
-    assert "body" not in result.data
-    assert "bodyStructure" not in result.data
-
-    # Verify blobId for external reference
-    assert "blobId" in result.data
-
-
 # ============================================================================
 # Error Handling Tests
 # ============================================================================
@@ -560,8 +439,8 @@ def test_gmail_invalid_input_missing_required_field(runtime, transforms_dir):
             validate_input=True,
         )
 
-    # Check the detailed errors attribute which contains validation messages
-    assert any("required" in str(err).lower() for err in exc_info.value.errors)
+    # Check the typed error codes instead of scanning message text
+    assert any(err.code is ErrorCode.REQUIRED for err in exc_info.value.errors)
 
 
 def test_exchange_invalid_input_wrong_type(runtime, transforms_dir):
@@ -655,12 +534,7 @@ def test_gmail_empty_headers_array(runtime, transforms_dir):
         }
     }
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, input_data)
 
     # Should still produce valid output with null/empty values
     assert result.data["id"] == "test123"
@@ -673,27 +547,13 @@ def test_exchange_null_recipients(runtime, transforms_dir):
     transform_meta = transforms_dir / "exchange_to_jmap_lite" / "1.0.0" / "spec.meta.yaml"
 
     input_data = {
-        "id": "test123",
-        "conversationId": "conv123",
-        "subject": "Test",
-        "bodyPreview": "Preview",
-        "from": {"emailAddress": {"name": "Sender", "address": "sender@example.com"}},
+        **BASE_EXCHANGE_INPUT,
         "toRecipients": [],  # Empty array instead of null (schema requires array type)
         "ccRecipients": [],
         "bccRecipients": [],
-        "sentDateTime": "2023-11-09T20:00:00Z",
-        "receivedDateTime": "2023-11-09T20:00:15Z",
-        "body": {"contentType": "text", "content": "Test"},
-        "internetMessageId": "<test@example.com>",
-        "internetMessageHeaders": []
     }
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, input_data)
 
     # Should handle empty recipient arrays gracefully
     assert result.data["to"] is None or result.data["to"] == []
@@ -704,8 +564,6 @@ def test_gmail_very_long_subject(runtime, transforms_dir):
     """Test Gmail transform with very long subject line (edge case)."""
     transform_meta = transforms_dir / "gmail_to_jmap_minimal" / "1.0.0" / "spec.meta.yaml"
 
-    long_subject = "A" * 10000  # 10KB subject line
-
     input_data = {
         "id": "test123",
         "threadId": "thread123",
@@ -717,7 +575,7 @@ def test_gmail_very_long_subject(runtime, transforms_dir):
             "headers": [
                 {"name": "From", "value": "sender@example.com"},
                 {"name": "To", "value": "recipient@example.com"},
-                {"name": "Subject", "value": long_subject},
+                {"name": "Subject", "value": _LONG_SUBJECT},
                 {"name": "Date", "value": "Thu, 9 Nov 2023 12:00:00 -0800"},
                 {"name": "Message-ID", "value": "<test@example.com>"}
             ],
@@ -728,16 +586,10 @@ def test_gmail_very_long_subject(runtime, transforms_dir):
         }
     }
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, input_data)
 
-    # Should preserve long subject
-    assert len(result.data["subject"]) == 10000
-    assert result.data["subject"] == long_subject
+    # Should preserve long subject (equality also covers the length)
+    assert result.data["subject"] == _LONG_SUBJECT
 
 
 # ============================================================================
@@ -749,32 +601,16 @@ def test_transform_with_many_recipients(runtime, transforms_dir):
     """Test Exchange transform with large number of recipients."""
     transform_meta = transforms_dir / "exchange_to_jmap_lite" / "1.0.0" / "spec.meta.yaml"
 
-    # Create 100 recipients
-    recipients = [
-        {"emailAddress": {"name": f"User{i}", "address": f"user{i}@example.com"}}
-        for i in range(100)
-    ]
 
     input_data = {
+        **BASE_EXCHANGE_INPUT,
         "id": "test_many_recipients",
-        "conversationId": "conv123",
         "subject": "Mass email",
         "bodyPreview": "Test",
-        "from": {"emailAddress": {"name": "Sender", "address": "sender@example.com"}},
-        "toRecipients": recipients,
-        "sentDateTime": "2023-11-09T20:00:00Z",
-        "receivedDateTime": "2023-11-09T20:00:15Z",
-        "body": {"contentType": "text", "content": "Test"},
-        "internetMessageId": "<test@example.com>",
-        "internetMessageHeaders": []
+        "toRecipients": MANY_RECIPIENTS,
     }
 
-    result = runtime.execute(
-        transform_meta_path=transform_meta,
-        input_data=input_data,
-        validate_input=True,
-        validate_output=True,
-    )
+    result = runtime.run(transform_meta, input_data)
 
     # Verify all recipients transformed
     assert len(result.data["to"]) == 100
@@ -787,46 +623,31 @@ def test_transform_with_many_recipients(runtime, transforms_dir):
 # ============================================================================
 
 
-def test_all_transforms_summary(runtime, transforms_dir):
-    """Summary test: Verify all 6 transforms can execute successfully."""
-    transforms = [
-        "gmail_to_jmap_full",
-        "gmail_to_jmap_lite",
-        "gmail_to_jmap_minimal",
-        "exchange_to_jmap_full",
-        "exchange_to_jmap_lite",
-        "exchange_to_jmap_minimal",
-    ]
+def test_all_transforms_summary(runtime, transforms_dir, load_json):
+    """Summary test: Verify all 6 transforms can execute successfully.
 
-    results = {}
-
-    for transform_id in transforms:
-        transform_meta = transforms_dir / transform_id / "1.0.0" / "spec.meta.yaml"
-        input_file = transforms_dir / transform_id / "1.0.0" / "tests" / "input.json"
-
-        with open(input_file) as f:
-            input_data = json.load(f)
+    The executes are independent Node subprocesses, so they run
+    concurrently; wall time is the slowest transform, not the sum.
+    """
 
+    def _run_one(transform_id):
+        transform_dir = transforms_dir / transform_id / "1.0.0"
         result = runtime.execute(
-            transform_meta_path=transform_meta,
-            input_data=input_data,
+            transform_meta_path=transform_dir / "spec.meta.yaml",
+            input_data=load_json(str(transform_dir / "tests" / "input.json")),
             validate_input=True,
             validate_output=True,
         )
+        return transform_id, result.execution_time_ms
 
-        results[transform_id] = {
-            "success": True,
-            "execution_time_ms": result.execution_time_ms,
-            "output_size": len(json.dumps(result.data)),
-        }
+    with ThreadPoolExecutor(max_workers=len(TRANSFORMS)) as pool:
+        results = dict(pool.map(_run_one, TRANSFORMS))
 
     # Verify all 6 transforms succeeded
     assert len(results) == 6
-    for transform_id, result_info in results.items():
-        assert result_info["success"] is True
-        assert result_info["execution_time_ms"] > 0
+    assert all(execution_time_ms > 0 for execution_time_ms in results.values())
 
     # Print summary (for debugging)
     print("\n=== Transform Execution Summary ===")
-    for transform_id, info in results.items():
-        print(f"{transform_id}: {info['execution_time_ms']:.2f}ms, {info['output_size']} bytes")
+    for transform_id, execution_time_ms in results.items():
+        print(f"{transform_id}: {execution_time_ms:.2f}ms")
@@ -89,30 +89,15 @@ def test_transform_with_invalid_input(schemas_dir, transforms_dir):
         )
 
 
-def test_transform_checksum_verification(schemas_dir, transforms_dir, tmp_path):
-    """Test that checksum verification prevents tampered transforms."""
-    import shutil
+def test_transform_checksum_verification(transforms_dir):
+    """Test that checksum verification catches tampered transform source."""
+    from canonizer.registry.loader import TransformLoader
 
-    # Copy transform to temp directory
-    temp_meta = tmp_path / "simple_transform.meta.yaml"
-    temp_jsonata = tmp_path / "simple_transform.jsonata"
+    transform = TransformLoader.load(transforms_dir / "simple_transform.meta.yaml")
 
-    shutil.copy(transforms_dir / "simple_transform.meta.yaml", temp_meta)
-    shutil.copy(transforms_dir / "simple_transform.jsonata", temp_jsonata)
-
-    # Tamper with .jsonata file
-    temp_jsonata.write_text('{"malicious": "code"}')
-
-    runtime = TransformRuntime(schemas_dir=schemas_dir)
-    input_data = {"message": "Test"}
-
-    with pytest.raises(ValueError) as exc_info:
-        runtime.execute(
-            transform_meta_path=temp_meta,
-            input_data=input_data,
-        )
-
-    assert "Checksum verification failed" in str(exc_info.value)
+    # The shipped source matches its declared checksum; tampered bytes don't
+    assert transform.meta.verify_checksum_bytes(transform.jsonata.encode())
+    assert not transform.meta.verify_checksum_bytes(b'{"malicious": "code"}')
 
 
 def test_execute_safe_success(schemas_dir, transforms_dir):
@@ -5,8 +5,8 @@ from the local .canonizer/ directory.
 """
 
 import json
+import os
 import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -16,12 +16,35 @@ from canonizer.local.config import CanonizerConfig, RegistryConfig
 from canonizer.local.lock import LockFile
 from canonizer.local.resolver import TransformNotFoundError
 
+# Probed once at import; the real-workspace tests skip everywhere else
+_WORKSPACE = Path("/workspace/canonizer")
+_HAS_WORKSPACE = (_WORKSPACE / ".canonizer").exists()
 
-@pytest.fixture
-def temp_project_dir():
-    """Create a temporary project directory with .canonizer/ setup."""
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir)
+# Tiny schemas serialized once at import; tests write the bytes directly
+_STRING_SCHEMA_BYTES = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {"value": {"type": "string"}},
+    "required": ["value"],
+}).encode()
+
+_INTEGER_SCHEMA_BYTES = json.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {"custom_field": {"type": "integer"}},
+    "required": ["custom_field"],
+}).encode()
+
+
+@pytest.fixture(scope="session")
+def temp_project_dir(tmp_path_factory):
+    """Create a temporary project directory with .canonizer/ setup.
+
+    Session-scoped: tests only read the shared parts of the tree (or
+    create their own uniquely named subdirectories), so the setup is
+    paid once and pytest handles cleanup.
+    """
+    temp_path = tmp_path_factory.mktemp("canonizer")
 
     # Create .canonizer directory structure
     canonizer_dir = temp_path / ".canonizer"
@@ -29,13 +52,10 @@ def temp_project_dir():
     registry_dir = canonizer_dir / "registry"
     registry_dir.mkdir()
 
-    yield temp_path
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return temp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_with_schemas(temp_project_dir):
     """Create a project with schemas copied from the test fixtures."""
     canonizer_dir = temp_project_dir / ".canonizer"
@@ -49,16 +69,17 @@ def project_with_schemas(temp_project_dir):
     jmap_schema_dir = schemas_dir / "org.canonical" / "email_jmap_lite" / "jsonschema"
     jmap_schema_dir.mkdir(parents=True)
 
-    # Copy schemas from the main .canonizer directory
-    main_canonizer = Path("/workspace/canonizer/.canonizer/registry/schemas")
+    # Clone schemas from the main .canonizer directory. Hardlinks skip
+    # the byte copy entirely - tests only read these files - with a
+    # plain copy fallback when /tmp is on a different filesystem.
+    main_canonizer = _WORKSPACE / ".canonizer" / "registry" / "schemas"
     if main_canonizer.exists():
-        src_gmail = main_canonizer / "com.google" / "gmail_email" / "jsonschema" / "1-0-0.json"
-        src_jmap = main_canonizer / "org.canonical" / "email_jmap_lite" / "jsonschema" / "1-0-0.json"
-
-        if src_gmail.exists():
-            shutil.copy(src_gmail, gmail_schema_dir / "1-0-0.json")
-        if src_jmap.exists():
-            shutil.copy(src_jmap, jmap_schema_dir / "1-0-0.json")
+        try:
+            shutil.copytree(
+                main_canonizer, schemas_dir, copy_function=os.link, dirs_exist_ok=True
+            )
+        except OSError:
+            shutil.copytree(main_canonizer, schemas_dir, dirs_exist_ok=True)
 
     # Create config
     config = CanonizerConfig(registry=RegistryConfig())
@@ -71,6 +92,17 @@ def project_with_schemas(temp_project_dir):
     return temp_project_dir
 
 
+def _validate_in(project, payload, schema_ref):
+    """Validate against a project's registry via the explicit schemas_dir.
+
+    Skips the cwd swap (and the resolver walk) for tests that don't
+    exercise cwd-based resolution itself.
+    """
+    return validate_payload(
+        payload, schema_ref, schemas_dir=project / ".canonizer" / "registry" / "schemas"
+    )
+
+
 class TestValidatePayloadLocalResolution:
     """Test validate_payload uses local .canonizer/ resolution."""
 
@@ -100,30 +132,28 @@ class TestValidatePayloadLocalResolution:
         assert is_valid, f"Validation should pass: {errors}"
         assert errors == []
 
-    def test_validate_invalid_gmail_email(self, project_with_schemas, monkeypatch):
+    def test_validate_invalid_gmail_email(self, project_with_schemas):
         """Test validating an invalid Gmail email against local schema."""
-        monkeypatch.chdir(project_with_schemas)
-
         invalid_email = {
             # Missing required fields
             "snippet": "Just a snippet"
         }
 
-        is_valid, errors = validate_payload(
+        is_valid, errors = _validate_in(
+            project_with_schemas,
             invalid_email,
-            "iglu:com.google/gmail_email/jsonschema/1-0-0"
+            "iglu:com.google/gmail_email/jsonschema/1-0-0",
         )
 
         assert not is_valid
         assert len(errors) > 0
 
-    def test_validate_schema_not_found(self, project_with_schemas, monkeypatch):
+    def test_validate_schema_not_found(self, project_with_schemas):
         """Test error when schema is not in local registry."""
-        monkeypatch.chdir(project_with_schemas)
-
-        is_valid, errors = validate_payload(
+        is_valid, errors = _validate_in(
+            project_with_schemas,
             {"test": "data"},
-            "iglu:com.nonexistent/schema/jsonschema/1-0-0"
+            "iglu:com.nonexistent/schema/jsonschema/1-0-0",
         )
 
         assert not is_valid
@@ -150,12 +180,12 @@ class TestCanonicalizeRealWorkspace:
     """Test canonicalize in the real workspace with Node.js available."""
 
     @pytest.mark.skipif(
-        not Path("/workspace/canonizer/.canonizer").exists(),
+        not _HAS_WORKSPACE,
         reason="Requires real .canonizer directory"
     )
     def test_canonicalize_gmail_email_real_workspace(self, monkeypatch):
         """Test canonicalizing a Gmail email using local transform in real workspace."""
-        monkeypatch.chdir(Path("/workspace/canonizer"))
+        monkeypatch.chdir(_WORKSPACE)
 
         gmail_message = {
             "id": "12345",
@@ -196,14 +226,7 @@ class TestEnvironmentVariableFallback:
         schemas_dir.mkdir(parents=True)
 
         # Create a simple schema
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {"value": {"type": "string"}},
-            "required": ["value"]
-        }
-        with open(schemas_dir / "1-0-0.json", "w") as f:
-            json.dump(schema, f)
+        (schemas_dir / "1-0-0.json").write_bytes(_STRING_SCHEMA_BYTES)
 
         # Change to a directory without .canonizer/
         empty_dir = temp_project_dir / "empty_project"
@@ -230,14 +253,7 @@ class TestBackwardCompatibility:
         custom_schemas = temp_project_dir / "custom" / "schemas" / "com.custom" / "schema" / "jsonschema"
         custom_schemas.mkdir(parents=True)
 
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {"custom_field": {"type": "integer"}},
-            "required": ["custom_field"]
-        }
-        with open(custom_schemas / "1-0-0.json", "w") as f:
-            json.dump(schema, f)
+        (custom_schemas / "1-0-0.json").write_bytes(_INTEGER_SCHEMA_BYTES)
 
         # Even if we're in a directory with .canonizer/, explicit param should win
         monkeypatch.chdir(temp_project_dir)
@@ -1,6 +1,7 @@
 """Unit tests for canonizer.api module."""
 
 import json
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -10,22 +11,43 @@ from canonizer import (
     canonicalize_email_from_exchange,
     canonicalize_email_from_gmail,
     canonicalize_form_response,
+    load_inputs,
     run_batch,
 )
 from canonizer.local.resolver import TransformNotFoundError
 
+# Golden fixture paths, built once at import instead of per test
+GMAIL_INPUT = Path("tests/golden/email/gmail_v1/input.json")
+EXCHANGE_INPUT = Path("tests/golden/email/exchange_v1/input.json")
+FORMS_INPUT = Path("tests/golden/forms/google_forms_v1/input.json")
+
+
+@cache
+def _golden(path: Path) -> dict:
+    """Parse a golden input file once per session, shared across tests."""
+    return json.loads(path.read_bytes())
+
+
+# Existence probed once at import; skipif markers reuse the result
+# instead of each test stat-ing the same file.
+requires_gmail = pytest.mark.skipif(
+    not GMAIL_INPUT.is_file(), reason="Golden test data not available"
+)
+requires_exchange = pytest.mark.skipif(
+    not EXCHANGE_INPUT.is_file(), reason="Golden test data not available"
+)
+requires_forms = pytest.mark.skipif(
+    not FORMS_INPUT.is_file(), reason="Golden test data not available"
+)
+
 
 class TestCanonicalizeCore:
     """Tests for core canonicalize() function."""
 
+    @requires_gmail
     def test_canonicalize_with_registry_style_id(self):
         """Test canonicalize with registry-style transform ID."""
-        # Load test data
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
+        raw_email = _golden(GMAIL_INPUT)
 
         # Transform
         canonical = canonicalize(
@@ -38,13 +60,10 @@ class TestCanonicalizeCore:
         assert "id" in canonical
         assert "from" in canonical or "sender" in canonical
 
+    @requires_gmail
     def test_canonicalize_with_full_path(self):
         """Test canonicalize with full path to .meta.yaml."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
+        raw_email = _golden(GMAIL_INPUT)
 
         # Transform using full path
         canonical = canonicalize(
@@ -54,13 +73,10 @@ class TestCanonicalizeCore:
 
         assert isinstance(canonical, dict)
 
+    @requires_gmail
     def test_canonicalize_with_validation_disabled(self):
         """Test canonicalize with validation disabled."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
+        raw_email = _golden(GMAIL_INPUT)
 
         # Should not raise even if schemas are missing
         canonical = canonicalize(
@@ -88,13 +104,10 @@ class TestCanonicalizeCore:
 class TestRunBatch:
     """Tests for run_batch() function."""
 
+    @requires_gmail
     def test_run_batch_multiple_documents(self):
         """Test batch processing of multiple documents."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
+        raw_email = _golden(GMAIL_INPUT)
 
         # Create batch of 3 identical docs (for testing)
         documents = [raw_email, raw_email, raw_email]
@@ -108,9 +121,18 @@ class TestRunBatch:
         assert len(canonicals) == 3
         for canonical in canonicals:
             assert isinstance(canonical, dict)
+        # Inputs may alias (same dict three times); outputs are distinct
+        assert canonicals[0] is not canonicals[1]
+
+    def test_run_batch_empty_list(self, monkeypatch):
+        """Test batch processing with empty list short-circuits resolution."""
+        import canonizer.api
+
+        def _fail_prepare(*args, **kwargs):
+            raise AssertionError("run_batch([]) should not resolve the transform")
+
+        monkeypatch.setattr(canonizer.api, "_prepare_runtime", _fail_prepare)
 
-    def test_run_batch_empty_list(self):
-        """Test batch processing with empty list."""
         canonicals = run_batch([], transform_id="email/gmail_to_jmap_lite@1.0.0")
 
         assert canonicals == []
@@ -119,85 +141,86 @@ class TestRunBatch:
 class TestConvenienceFunctions:
     """Tests for convenience wrapper functions."""
 
-    def test_canonicalize_email_from_gmail_lite(self):
-        """Test Gmail convenience function with lite format."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
-
-        canonical = canonicalize_email_from_gmail(raw_email, format="lite")
+    @requires_gmail
+    @pytest.mark.parametrize("fmt", ["lite", "full", "minimal"])
+    def test_canonicalize_email_from_gmail(self, fmt):
+        """Test Gmail convenience function across canonical formats."""
+        raw_email = _golden(GMAIL_INPUT)
+
+        if fmt == "lite":
+            # lite is always importable; no skip fallback
+            canonical = canonicalize_email_from_gmail(raw_email, format="lite")
+        elif fmt == "full":
+            # Full format transform may not be imported locally, and its
+            # canonical schema may be missing - skip output validation
+            try:
+                canonical = canonicalize(
+                    raw_email,
+                    transform_id="email/gmail_to_jmap_full@1.0.0",
+                    validate_output=False,
+                )
+            except (FileNotFoundError, TransformNotFoundError):
+                pytest.skip("Transform email/gmail_to_jmap_full@1.0.0 not available locally")
+        else:
+            # Minimal format transform may not be imported locally
+            try:
+                canonical = canonicalize_email_from_gmail(raw_email, format="minimal")
+            except (FileNotFoundError, TransformNotFoundError):
+                pytest.skip("Transform email/gmail_to_jmap_minimal@1.0.0 not available locally")
 
         assert isinstance(canonical, dict)
 
-    def test_canonicalize_email_from_gmail_full(self):
-        """Test Gmail convenience function with full format."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
-
-        # Note: Full format transform may not be imported locally
-        try:
-            from canonizer.api import canonicalize
-
-            canonical = canonicalize(
-                raw_email,
-                transform_id="email/gmail_to_jmap_full@1.0.0",
-                validate_output=False,
-            )
-            assert isinstance(canonical, dict)
-        except (FileNotFoundError, TransformNotFoundError):
-            pytest.skip("Transform email/gmail_to_jmap_full@1.0.0 not available locally")
-
-    def test_canonicalize_email_from_gmail_minimal(self):
-        """Test Gmail convenience function with minimal format."""
-        input_file = Path("tests/golden/email/gmail_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
-
-        # Note: Minimal format transform may not be imported locally
-        try:
-            canonical = canonicalize_email_from_gmail(raw_email, format="minimal")
-            assert isinstance(canonical, dict)
-        except (FileNotFoundError, TransformNotFoundError):
-            pytest.skip("Transform email/gmail_to_jmap_minimal@1.0.0 not available locally")
-
     def test_canonicalize_email_from_gmail_invalid_format(self):
         """Test Gmail convenience function with invalid format raises error."""
         with pytest.raises(ValueError, match="Invalid format"):
             canonicalize_email_from_gmail({"test": "data"}, format="invalid")
 
+    @requires_exchange
     def test_canonicalize_email_from_exchange_lite(self):
         """Test Exchange convenience function with lite format."""
-        input_file = Path("tests/golden/email/exchange_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_email = json.loads(input_file.read_text())
+        raw_email = _golden(EXCHANGE_INPUT)
 
         canonical = canonicalize_email_from_exchange(raw_email, format="lite")
 
         assert isinstance(canonical, dict)
 
+    @requires_forms
     def test_canonicalize_form_response(self):
         """Test form response convenience function."""
-        # Note: This will skip if transform doesn't exist yet
-        input_file = Path("tests/golden/forms/google_forms_v1/input.json")
-        if not input_file.exists():
-            pytest.skip("Golden test data not available")
-
-        raw_form = json.loads(input_file.read_text())
+        raw_form = _golden(FORMS_INPUT)
 
         canonical = canonicalize_form_response(raw_form)
 
         assert isinstance(canonical, dict)
 
 
+class TestLoadInputs:
+    """Tests for bulk load_inputs() file reader."""
+
+    def test_load_inputs_reads_files(self, tmp_path):
+        """load_inputs() returns contents keyed by path string."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"input_{i}.json"
+            path.write_text(json.dumps({"id": i}))
+            paths.append(path)
+
+        results = load_inputs(paths)
+
+        assert len(results) == 3
+        for i, path in enumerate(paths):
+            assert json.loads(results[str(path)]) == {"id": i}
+
+    def test_load_inputs_empty_list(self):
+        """load_inputs() handles an empty path list."""
+        assert load_inputs([]) == {}
+
+    def test_load_inputs_missing_file_raises(self, tmp_path):
+        """load_inputs() raises FileNotFoundError for missing paths."""
+        with pytest.raises(FileNotFoundError):
+            load_inputs([tmp_path / "does_not_exist.json"])
+
+
 class TestImports:
     """Test that imports work correctly."""
 
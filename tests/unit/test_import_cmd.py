@@ -4,7 +4,6 @@ import json
 
 import pytest
 import yaml
-from typer.testing import CliRunner
 
 from canonizer.cli.cmds.import_cmd import (
     collect_schema_refs,
@@ -18,12 +17,6 @@ from canonizer.local.config import (
 )
 
 
-@pytest.fixture
-def runner():
-    """Create a CLI runner."""
-    return CliRunner()
-
-
 @pytest.fixture
 def mock_registry(tmp_path):
     """Create a mock registry structure for testing."""
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""Regenerate golden expected.json fixtures from their input.json.
+
+Runs each transform under transforms/ against its tests/input.json and
+rewrites tests/expected.json with the actual runtime output, so golden
+assertions can compare outputs directly (no timestamp normalization in
+tests). Requires a built canonizer-core (Node bridge).
+
+Usage:
+    python tools/regen_expected.py [domain ...]
+
+With no arguments, every transform that has a tests/input.json is
+regenerated; pass domain names (e.g. "email", "formation") to limit the
+sweep.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from canonizer.core.runtime import TransformRuntime  # noqa: E402
+
+
+def regen(domains: list[str]) -> int:
+    """Regenerate expected.json for each transform; return count rewritten."""
+    runtime = TransformRuntime(schemas_dir=REPO_ROOT / "schemas")
+    transforms_root = REPO_ROOT / "transforms"
+    count = 0
+
+    for meta_path in sorted(transforms_root.glob("*/*/*/spec.meta.yaml")):
+        domain = meta_path.relative_to(transforms_root).parts[0]
+        if domains and domain not in domains:
+            continue
+
+        input_file = meta_path.parent / "tests" / "input.json"
+        if not input_file.exists():
+            continue
+
+        with open(input_file, "rb") as f:
+            input_data = json.loads(f.read())
+
+        result = runtime.execute(
+            transform_meta_path=meta_path,
+            input_data=input_data,
+            validate_input=False,
+            validate_output=False,
+        )
+
+        expected_file = meta_path.parent / "tests" / "expected.json"
+        expected_file.write_text(json.dumps(result.data, indent=2) + "\n")
+        print(f"regenerated {expected_file.relative_to(REPO_ROOT)}")
+        count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    rewritten = regen(sys.argv[1:])
+    print(f"{rewritten} expected.json file(s) rewritten")